@@ -1,18 +1,3 @@
-import re
-
-def format_human_date(iso_str):
-    """Convert ISO date string to human-readable format: 'Dec 1, 2025, 2:30 PM'"""
-    if not iso_str:
-        return ""
-    try:
-        dt = datetime.fromisoformat(iso_str)
-        # Use %-d and %-I for Linux/Mac, fallback for Windows
-        try:
-            return dt.strftime("%b %-d, %Y, %-I:%M %p")
-        except:
-            return dt.strftime("%b %d, %Y, %I:%M %p").replace(" 0", " ")
-    except Exception:
-        return iso_str
 """CourseMate Application Module
 
 Core definitions for data persistence, themed UI components, note/dialog views,
@@ -20,7 +5,17 @@ and the main application shell. Comments are concise for panel review.
 """
 
 import customtkinter as ctk
+import atexit
 import json
+import queue
+import random
+import shutil
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from types import MappingProxyType
+import threading
 import uuid
 from datetime import datetime
 import os
@@ -31,6 +26,9 @@ from tkinter import messagebox, simpledialog
 import ctypes
 import os
 
+# Verbose startup logging (set COURSEMATE_DEBUG=1)
+DEBUG = bool(os.environ.get("COURSEMATE_DEBUG"))
+
 # Simple icon loading system
 try:
     from PIL import Image, ImageOps
@@ -40,6 +38,67 @@ except ImportError:
     PIL_AVAILABLE = False
     print("Warning: PIL (Pillow) not available. Icons will not be displayed.")
 
+# Optional faster JSON codec for the data file (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# The data file is written as compact JSON; set COURSEMATE_PRETTY_JSON=1 to
+# keep it indented for hand inspection (DataManager.export is always indented).
+PRETTY_JSON = os.environ.get("COURSEMATE_PRETTY_JSON") == "1"
+
+def json_dumps_bytes(obj, pretty=False):
+    """Serialize obj to UTF-8 JSON bytes, using orjson when installed.
+
+    Compact by default; pretty=True indents by two spaces. Data orjson
+    refuses (e.g. non-string dict keys, which json coerces) goes through
+    the stdlib encoder instead.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except orjson.JSONEncodeError:
+            pass
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def json_loads_bytes(raw):
+    """Parse JSON from bytes, using orjson when installed.
+
+    Both backends raise a ValueError subclass on malformed input.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+@lru_cache(maxsize=1)
+def _resolve_icon_path():
+    """Return the first application icon found in assets/icons, or None.
+
+    Prefers .ico (Windows taskbar/alt-tab) over PNG. Cached, so the
+    directory is probed once per process.
+    """
+    icon_dir = os.path.join(os.path.dirname(__file__), "assets", "icons")
+    for ico_name in ("app.ico", "icon.ico", "app.png", "icon.png"):
+        ico_path = os.path.join(icon_dir, ico_name)
+        if os.path.exists(ico_path):
+            return ico_path
+    return None
+
+@lru_cache(maxsize=1)
+def _custom_font_paths():
+    """Return the .ttf/.otf files bundled in assets/fonts (cached per process)."""
+    font_dir = os.path.join(os.path.dirname(__file__), "assets", "fonts")
+    try:
+        with os.scandir(font_dir) as entries:
+            return tuple(e.path for e in entries
+                         if e.name.lower().endswith((".ttf", ".otf")) and e.is_file())
+    except OSError:
+        return ()
+
 def load_icon(filename, size=(20, 20)):
     """Load an icon and return a CTkImage.
     
@@ -111,6 +170,129 @@ import re
 from tags_utils import extract_hashtags_from_text
 
 
+# ------------------------
+# Date and note text helpers
+# ------------------------
+# Timestamps are immutable strings and note cards re-render the same ones on
+# every refresh, so the parse + strftime result is memoized per string.
+@lru_cache(maxsize=4096)
+def format_human_date(iso_str):
+    """Convert ISO date string to human-readable format: 'Dec 1, 2025, 2:30 PM'"""
+    if not iso_str:
+        return ""
+    try:
+        dt = datetime.fromisoformat(iso_str)
+        # Use %-d and %-I for Linux/Mac, fallback for Windows
+        try:
+            return dt.strftime("%b %-d, %Y, %-I:%M %p")
+        except:
+            return dt.strftime("%b %d, %Y, %I:%M %p").replace(" 0", " ")
+    except Exception:
+        return iso_str
+
+# Legacy timestamp format written by older builds ("December 1, 2025 | 2:30PM")
+LEGACY_DATE_FORMAT = "%B %d, %Y | %I:%M%p"
+
+def parse_note_datetime(value):
+    """Parse a note timestamp for sorting; returns datetime.min if unparseable.
+
+    Fast path is the C-level ISO parser (what load_data normalizes to); the
+    strptime fallback only runs for legacy strings.
+    """
+    if not value:
+        return datetime.min
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.strptime(value, LEGACY_DATE_FORMAT)
+    except (TypeError, ValueError):
+        return datetime.min
+
+# Values derived from a note's text (search blob, previews...), keyed by note
+# id. Views work on shallow copies of note dicts, so entries are validated by
+# the identity of the title/content/tags objects rather than the dict itself;
+# editing a note assigns new objects, which invalidates its entry.
+_note_derived_cache = {}
+# Shared default for notes without 'tags', so their entries validate too
+_NO_TAGS = ()
+
+def note_derived(note):
+    """Return the cache dict of derived values for note (empty if its text changed)."""
+    title = note.get('title', '')
+    content = note.get('content', '')
+    tags = note.get('tags', _NO_TAGS)
+    note_id = note.get('id')
+    if not note_id:
+        return {}  # nothing stable to key on; callers just recompute
+    entry = _note_derived_cache.get(note_id)
+    if entry is not None and entry[0] is title and entry[1] is content and entry[2] is tags:
+        return entry[3]
+    derived = {}
+    _note_derived_cache[note_id] = (title, content, tags, derived)
+    return derived
+
+def note_search_text(note):
+    """Lowercased title, content and tags of note, for substring search."""
+    derived = note_derived(note)
+    blob = derived.get('search')
+    if blob is None:
+        blob = derived['search'] = "\n".join((
+            note.get('title', ''), note.get('content', ''), " ".join(note.get('tags', [])),
+        )).lower()
+    return blob
+
+def note_preview_words(note, count=3):
+    """First few words of note's content, as shown on note cards."""
+    derived = note_derived(note)
+    key = ('preview_words', count)
+    preview = derived.get(key)
+    if preview is None:
+        # maxsplit keeps the rest of a long note as one untouched tail
+        preview = derived[key] = " ".join(note.get('content', '').split(None, count)[:count])
+    return preview
+
+# Line breaks and tabs flattened to spaces in one pass for one-line previews
+_PREVIEW_TRANS = str.maketrans({'\n': ' ', '\r': ' ', '\t': ' '})
+
+def note_preview_text(note, length=100):
+    """One-line start of note's content (line breaks as spaces) ending in '...'."""
+    derived = note_derived(note)
+    key = ('preview_text', length)
+    preview = derived.get(key)
+    if preview is None:
+        preview = derived[key] = note.get('content', '')[:length].translate(_PREVIEW_TRANS) + "..."
+    return preview
+
+def note_tags_text(note):
+    """Note's tags as shown on cards ('#a #b'), or '' when it has none."""
+    derived = note_derived(note)
+    text = derived.get('tags_text')
+    if text is None:
+        text = derived['tags_text'] = " ".join(
+            t if t.startswith('#') else f"#{t}" for t in note.get('tags', []))
+    return text
+
+def forget_note_derived(notes):
+    """Drop the cached derived values of deleted notes."""
+    for note in notes:
+        _note_derived_cache.pop(note.get('id'), None)
+
+@lru_cache(maxsize=512)
+def truncate_label(text, limit=25):
+    """Shorten text to at most limit characters, ending in '...' when cut."""
+    if len(text) <= limit:
+        return text
+    return text[:max(limit - 3, 0)] + "..."
+
+
+@lru_cache(maxsize=64)
+def fallback_font(family, base_size, size_offset=0, weight="normal", slant="roman"):
+    """Font tuple for views used without the main window's get_font."""
+    return (family, base_size + size_offset, weight, slant)
+
+
 # ------------------------
 # Color utilities
 # ------------------------
@@ -471,6 +653,9 @@ THEMES = {
     }
 }
 
+# Freeze the palettes: every view shares these mappings read-only
+THEMES = {name: MappingProxyType(palette) for name, palette in THEMES.items()}
+
 DEFAULT_SETTINGS = {
     "theme": "CourseMate Theme",
     "font_family": "Open Sans",
@@ -482,6 +667,28 @@ DEFAULT_SETTINGS = {
     "additional_templates": {}
 }
 
+# Delay before a search box re-filters its list after the last keystroke
+SEARCH_DEBOUNCE_MS = 150
+# Delay before a DataManager.mark_dirty() change is written to disk
+SAVE_DEBOUNCE_MS = 500
+# Note cards are built one page at a time; "Show more" reveals the next page
+NOTE_CARD_PAGE_SIZE = 40
+# Settings lists (quotes, templates) are built one page of rows at a time
+SETTINGS_ROW_PAGE_SIZE = 30
+# Allowed range of the quote_timer setting, in seconds (up to one day)
+QUOTE_TIMER_MIN = 5
+QUOTE_TIMER_MAX = 24 * 60 * 60
+
+# Built-in study templates (user-saved ones with the same title override these)
+DEFAULT_STUDY_TEMPLATES = {
+    "Cornell Notes": "Title: \n\nQuestion/Keyword\n-\n-\n\nNotes\n-\n-\n\nSummary\n-\n_",
+    "Main Idea & Details": "Main Idea: ___\n\nDetail 1:\n-\n\nDetail 2:\n-\n\nDetail 3:\n-\n\nSummary:\n-",
+    "Modified Frayer Model": "Definition:\n-\n\nCharacteristics:\n-\n\nExamples:\n-\n\nNon-Examples:\n-",
+    "Polya's 4 Steps": "1. Understand the Problem:\n-\n\n2. Devise a Plan:\n-\n\n3. Carry Out the Plan:\n-\n\n4. Look Back:\n-",
+    "5W1H": "Who:\n-\n\nWhat:\n-\n\nWhen:\n-\n\nWhere:\n-\n\nWhy:\n-\n\nHow:\n-",
+    "Concept Map": "Central Concept:\n-\n\nRelated Concept 1:\n-\n\nRelated Concept 2:\n-\n\nConnections:\n-"
+}
+
 # Default planner / organizational templates for the new Additional Templates category
 DEFAULT_ADDITIONAL_TEMPLATES = {
     "Daily Planner": "Date: \n\nTop 3 Priorities:\n1. \n2. \n3. \n\nSchedule (Hour | Task):\n08:00 - \n09:00 - \n10:00 - \n11:00 - \n12:00 - \n13:00 - \n14:00 - \n15:00 - \n16:00 - \n17:00 - \n\nTasks:\n- [ ] \n- [ ] \n- [ ] \n\nNotes:\n- ",
@@ -505,6 +712,9 @@ DEFAULT_QUOTES = [
 # DATA MANAGER
 # ============================================================================
 
+_MISSING = object()  # sentinel for "key not present" lookups
+
+
 class DataManager:
     """
     Persistent storage layer. Responsibilities:
@@ -512,73 +722,40 @@ class DataManager:
         - Migrate legacy structures to current schema
         - Provide helper methods for notebooks, notes, tasks, and settings.
         """
+    __slots__ = ('filepath', 'data', '_dirty', '_batch_depth', '_title_index', '_code_index', '_note_index', '_counts', '_version',
+                 '_scheduler', '_flush_after_id', '_write_lock', '_write_seq', '_written_seq', '_last_payload',
+                 '_write_queue', '_writer', '_write_failed', '_check_after_id')
+
     def move_note_by_id(self, note_id, source_notebook, target_notebook):
         """Move a note by its unique id from source_notebook to target_notebook (or unassigned)."""
-        # If moving to unassigned
-        if target_notebook is None:
-            # Remove from source notebook
-            found = False
-            for code, nb_data in self.data["notebooks"].items():
-                notes = nb_data.get("notes", [])
-                for n in notes:
-                    if n.get("id") == note_id:
-                        notes.remove(n)
-                        n["notebook"] = None
-                        self.data["unassigned_notes"].append(n)
-                        self.save_data()
-                        return True, "Note moved to Unassigned Notes."
-            # Fallback: search all notebooks for note
-            for code, nb_data in self.data["notebooks"].items():
-                notes = nb_data.get("notes", [])
-                for n in notes:
-                    if n.get("id") == note_id:
-                        notes.remove(n)
-                        n["notebook"] = None
-                        self.data["unassigned_notes"].append(n)
-                        self.save_data()
-                        return True, "Note moved to Unassigned Notes (fallback)."
+        # The note's current list comes from the id index, so source_notebook
+        # (which callers may not know reliably) is not needed to find it.
+        source = self._note_list_for(note_id)
+        if source is None:
             return False, "Note not found in any notebook."
-        # Remove from unassigned if present
-        for n in self.data["unassigned_notes"]:
-            if n.get("id") == note_id:
-                self.data["unassigned_notes"].remove(n)
-                n["notebook"] = target_notebook
-                # Add to target notebook
-                for code, nb_data in self.data["notebooks"].items():
-                    if nb_data.get("name") == target_notebook:
-                        nb_data["notes"].append(n)
-                        self.save_data()
-                        return True, "Note moved from Unassigned to notebook."
+        if target_notebook is None:
+            target = self.data["unassigned_notes"]
+        else:
+            target = self._notes_of(target_notebook)
+            if target is None:
                 return False, "Target notebook not found."
-        # Otherwise, move from one notebook to another
-        found = False
-        for code, nb_data in self.data["notebooks"].items():
-            notes = nb_data.get("notes", [])
-            for n in notes:
-                if n.get("id") == note_id:
-                    notes.remove(n)
-                    n["notebook"] = target_notebook
-                    # Add to target notebook
-                    for tcode, tnb_data in self.data["notebooks"].items():
-                        if tnb_data.get("name") == target_notebook:
-                            tnb_data["notes"].append(n)
-                            self.save_data()
-                            return True, "Note moved to target notebook."
-                    return False, "Target notebook not found."
-        # Fallback: search all notebooks for note
-        for code, nb_data in self.data["notebooks"].items():
-            notes = nb_data.get("notes", [])
-            for n in notes:
-                if n.get("id") == note_id:
-                    notes.remove(n)
-                    n["notebook"] = target_notebook
-                    for tcode, tnb_data in self.data["notebooks"].items():
-                        if tnb_data.get("name") == target_notebook:
-                            tnb_data["notes"].append(n)
-                            self.save_data()
-                            return True, "Note moved to target notebook (fallback)."
-                    return False, "Target notebook not found."
-        return False, "Note not found in any notebook."
+        if target is source:
+            # Nothing to move; skip the pop/append and the file write
+            where = "Unassigned Notes" if target_notebook is None else f"'{target_notebook}'"
+            return False, f"Note is already in {where}."
+        from_unassigned = source is self.data["unassigned_notes"]
+        note = source.pop(self._position_in(source, note_id))
+        note["notebook"] = target_notebook
+        target.append(note)
+        self._note_index[note_id] = target
+        # Moves are rare; let both sides' title sets rebuild on demand
+        self._title_index.clear()
+        self._commit_change()
+        if target_notebook is None:
+            return True, "Note moved to Unassigned Notes."
+        if from_unassigned:
+            return True, "Note moved from Unassigned to notebook."
+        return True, "Note moved to target notebook."
     
     def __init__(self, filepath="Coursemate_data.json"):
         self.filepath = Path(filepath)
@@ -587,76 +764,140 @@ class DataManager:
             "unassigned_notes": [],
             "settings": DEFAULT_SETTINGS.copy()
         }
+        self._dirty = False      # in-memory data differs from the file
+        self._batch_depth = 0    # > 0 while inside batch()
+        # notebook name (None = unassigned) -> set of casefolded note titles.
+        # Built lazily by note_exists, dropped whenever the data changes.
+        self._title_index = {}
+        self._note_index = None  # note id -> list holding it; None = rebuild on use
+        self._code_index = {}  # casefolded course code -> code as entered
+        self._counts = None    # cached (notebooks, notes) for get_counts
+        self._version = 0      # bumped on every change, see version
+        # Deferred saves (mark_dirty/flush): a Tk widget supplies after(),
+        # snapshots are numbered so an older one never overwrites a newer one
+        self._scheduler = None
+        self._flush_after_id = None
+        self._write_lock = threading.Lock()
+        self._write_seq = 0
+        self._written_seq = 0
+        self._last_payload = None  # bytes of the last successful write
+        # One long-lived writer thread; the queue holds at most the newest
+        # pending snapshot (see _enqueue_write)
+        self._write_queue = queue.Queue(maxsize=1)
+        self._writer = None
+        self._write_failed = False    # set by the writer thread, see _check_background_write
+        self._check_after_id = None
         self.load_data()
+        self._rebuild_code_index()
 
     def load_data(self):
+        # One "now" stamp for the whole load: notes with missing or
+        # unreadable dates all get the same fallback instead of calling
+        # datetime.now() once per note.
+        now_iso = datetime.now().isoformat()
+
+        # Standardize date fields to ISO 8601
+        def to_iso(dt):
+            if not dt:
+                return now_iso
+            try:
+                # Try ISO first
+                return datetime.fromisoformat(dt).isoformat()
+            except Exception:
+                # Try known formats
+                for fmt in [LEGACY_DATE_FORMAT, "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"]:
+                    try:
+                        return datetime.strptime(dt, fmt).isoformat()
+                    except Exception:
+                        continue
+            return now_iso
+
         def migrate_note(note, notebook_name=None):
             # Ensure notebook field
             note['notebook'] = notebook_name if notebook_name else None
             # Ensure id field
             if 'id' not in note or not note['id']:
                 note['id'] = str(uuid.uuid4())
-            # Standardize date fields to ISO 8601
-            def to_iso(dt):
-                if not dt:
-                    return datetime.now().isoformat()
-                try:
-                    # Try ISO first
-                    return datetime.fromisoformat(dt).isoformat()
-                except Exception:
-                    # Try known formats
-                    for fmt in ["%B %d, %Y | %I:%M%p", "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"]:
-                        try:
-                            return datetime.strptime(dt, fmt).isoformat()
-                        except Exception:
-                            continue
-                return datetime.now().isoformat()
             note['created'] = to_iso(note.get('created'))
             if 'modified' in note:
                 note['modified'] = to_iso(note.get('modified'))
             return note
 
-        if hasattr(self, 'filepath') and self.filepath.exists():
-            try:
-                with open(self.filepath, 'r') as f:
-                    loaded_data = json.load(f)
-                notebooks = loaded_data.get("notebooks", {})
-                for code, nb_data in notebooks.items():
-                    if "name" not in nb_data or not nb_data.get("name"):
-                        nb_data["name"] = code
-                    nb_data.pop("tasks", None)
-                    nb_data.pop("completed_tasks", None)
-                    notes = nb_data.get('notes', [])
-                    for i, note in enumerate(notes):
-                        notes[i] = migrate_note(note, nb_data['name'])
-                self.data["notebooks"] = notebooks
-                self.data["unassigned_notes"] = [migrate_note(n, None) for n in loaded_data.get("unassigned_notes", [])]
-                saved_settings = loaded_data.get("settings", {})
-                for k, v in DEFAULT_SETTINGS.items():
-                    if k not in saved_settings:
-                        saved_settings[k] = v
-                # Remove legacy custom_templates migration (no longer needed)
-                if "study_templates" not in saved_settings:
-                    saved_settings["study_templates"] = {}
-                if "additional_templates" not in saved_settings:
-                    saved_settings["additional_templates"] = {}
-                if not saved_settings["additional_templates"]:
-                    saved_settings["additional_templates"] = DEFAULT_ADDITIONAL_TEMPLATES.copy()
-                move_keys = [
-                    k for k in list(saved_settings.get("study_templates", {}).keys())
-                    if k.lower() in ("weekly planning", "weekly planner", "weekly overview")
-                ]
-                for k in move_keys:
-                    val = saved_settings["study_templates"].pop(k)
-                    if k not in saved_settings["additional_templates"]:
-                        saved_settings["additional_templates"][k] = val
-                self.data["settings"] = saved_settings
-                self._cleanup_invalid_notebooks()
-            except Exception as e:
-                print(f"Error loading data: {e}")
-        else:
+        try:
+            # One read into a contiguous buffer; json.loads detects the
+            # UTF encoding of bytes input itself. A missing file surfaces as
+            # FileNotFoundError instead of being probed with exists() first.
+            loaded_data = json_loads_bytes(self.filepath.read_bytes())
+        except FileNotFoundError:
+            # First run: write the defaults
             self.save_data()
+            return
+        except (OSError, UnicodeDecodeError, ValueError) as e:
+            print(f"Error loading data: {e}")
+            self._backup_corrupt_file()
+            return
+        if not self._has_valid_layout(loaded_data):
+            print(f"Error loading data: unexpected layout in {self.filepath}")
+            self._backup_corrupt_file()
+            return
+        try:
+            notebooks = loaded_data.get("notebooks", {})
+            for code, nb_data in notebooks.items():
+                if "name" not in nb_data or not nb_data.get("name"):
+                    nb_data["name"] = code
+                nb_data.pop("tasks", None)
+                nb_data.pop("completed_tasks", None)
+                notes = nb_data.get('notes', [])
+                for i, note in enumerate(notes):
+                    notes[i] = migrate_note(note, nb_data['name'])
+            self.data["notebooks"] = notebooks
+            self.data["unassigned_notes"] = [migrate_note(n, None) for n in loaded_data.get("unassigned_notes", [])]
+            saved_settings = loaded_data.get("settings", {})
+            for k, v in DEFAULT_SETTINGS.items():
+                if k not in saved_settings:
+                    saved_settings[k] = v
+            # Remove legacy custom_templates migration (no longer needed)
+            if "study_templates" not in saved_settings:
+                saved_settings["study_templates"] = {}
+            if "additional_templates" not in saved_settings:
+                saved_settings["additional_templates"] = {}
+            if not saved_settings["additional_templates"]:
+                saved_settings["additional_templates"] = DEFAULT_ADDITIONAL_TEMPLATES.copy()
+            move_keys = [
+                k for k in list(saved_settings.get("study_templates", {}).keys())
+                if k.lower() in ("weekly planning", "weekly planner", "weekly overview")
+            ]
+            for k in move_keys:
+                val = saved_settings["study_templates"].pop(k)
+                if k not in saved_settings["additional_templates"]:
+                    saved_settings["additional_templates"][k] = val
+            self.data["settings"] = saved_settings
+            self._cleanup_invalid_notebooks()
+        except Exception as e:
+            print(f"Error loading data: {e}")
     
+    @staticmethod
+    def _has_valid_layout(loaded_data):
+        """Cheap structural check of a parsed data file before migrating it."""
+        if not isinstance(loaded_data, dict):
+            return False
+        notebooks = loaded_data.get("notebooks", {})
+        if not isinstance(notebooks, dict):
+            return False
+        if not all(isinstance(nb, dict) and isinstance(nb.get("notes", []), list) for nb in notebooks.values()):
+            return False
+        return (isinstance(loaded_data.get("unassigned_notes", []), list)
+                and isinstance(loaded_data.get("settings", {}), dict))
+
+    def _backup_corrupt_file(self):
+        """Keep a copy of an unreadable data file so the next save can't erase it."""
+        backup = self.filepath.with_name(self.filepath.name + ".corrupt")
+        try:
+            shutil.copy2(self.filepath, backup)
+            print(f"Unreadable data file backed up to {backup}")
+        except OSError as e:
+            print(f"Could not back up unreadable data file: {e}")
+
     def _cleanup_invalid_notebooks(self):
         """Remove notebooks with empty or whitespace-only codes"""
         invalid_codes = [code for code in self.data["notebooks"].keys() if not code or not code.strip()]
@@ -664,17 +905,254 @@ class DataManager:
             print(f"Cleaning up {len(invalid_codes)} invalid notebook(s)...")
             for code in invalid_codes:
                 del self.data["notebooks"][code]
-            self.save_data()
+            self._counts = None
+            self._title_index.clear()
+            self._note_index = None
+            self._commit_change()
 
     def save_data(self):
+        # Views edit note dicts in place and then call save_data, so any
+        # save may have changed titles or counts.
+        self._invalidate_caches()
+        self._write_file()
+
+    def mark_dirty(self, counts_changed=True):
+        """Like save_data, but coalesce the write with others shortly after.
+
+        Without an attached scheduler (see attach_scheduler) this writes
+        immediately. Pass counts_changed=False after edits that added or
+        removed no notes or notebooks, so get_counts keeps its totals.
+        """
+        counts = self._counts
+        self._invalidate_caches()
+        if not counts_changed:
+            self._counts = counts
+        self._dirty = True
+        self._schedule_write()
+
+    def _schedule_write(self):
+        """Write now without a scheduler, else once SAVE_DEBOUNCE_MS after the first change."""
+        if self._scheduler is None:
+            self._write_file()
+        elif self._flush_after_id is None:
+            self._flush_after_id = self._scheduler.after(SAVE_DEBOUNCE_MS, self._scheduled_flush)
+
+    def attach_scheduler(self, widget):
+        """Use widget.after() to time the deferred writes of mark_dirty and
+        every DataManager mutation.
+
+        The owner flushes when its window closes; changes still pending at
+        interpreter exit are written by _flush_at_exit.
+        """
+        if self._scheduler is None:
+            atexit.register(self._flush_at_exit)
+        self._scheduler = widget
+
+    def _flush_at_exit(self):
+        """Last-chance write at exit. Tk may be gone by then, so errors go to stderr."""
+        # A snapshot still queued for the (daemon) writer thread would die
+        # with the process, so it counts as pending too; it's re-taken below
+        if not self._dirty and self._write_seq <= self._written_seq:
+            return
+        try:
+            self._store(*self._snapshot())
+        except Exception as e:
+            print(f"Error saving data at exit: {e}", file=sys.stderr)
+
+    def flush(self, wait=False):
+        """Write pending changes now.
+
+        The data is serialized on the calling (UI) thread; the file write
+        runs on the writer thread unless wait is True. wait=True also
+        waits for snapshots already handed to the writer thread, so the file
+        is up to date when it returns (use it before exiting).
+        """
+        if self._flush_after_id is not None:
+            try:
+                self._scheduler.after_cancel(self._flush_after_id)
+            except Exception:
+                pass
+            self._flush_after_id = None
+        if wait and not self._dirty:
+            # An earlier snapshot may still be queued or being written; wait
+            # until the writer thread has finished with it
+            self._write_queue.join()
+        if not self._dirty:
+            return  # (a failed background write sets _dirty again)
+        if wait or self._scheduler is None:
+            self._write_file()
+            return
+        try:
+            seq, payload = self._snapshot()
+        except Exception as e:
+            self._dirty = True
+            print(f"Error saving data: {e}")
+            messagebox.showerror("Save Error", f"Could not save data: {e}")
+            return
+        self._enqueue_write(seq, payload)
+        if self._check_after_id is None:
+            self._check_after_id = self._scheduler.after(SAVE_DEBOUNCE_MS, self._check_background_write)
+
+    def _scheduled_flush(self):
+        self._flush_after_id = None
+        self.flush()
+
+    def _check_background_write(self):
+        """Follow up on the writer thread from the UI thread; retry a failed write."""
+        self._check_after_id = None
+        if self._write_failed:
+            self._write_failed = False
+            self._schedule_write()  # the writer already set _dirty again
+        elif self._write_queue.unfinished_tasks:
+            self._check_after_id = self._scheduler.after(SAVE_DEBOUNCE_MS, self._check_background_write)
+
+    def _invalidate_caches(self):
+        self._version += 1
+        self._title_index.clear()
+        self._note_index = None
+        self._counts = None
+
+    def _snapshot(self):
+        """Serialize the data and number the result; clears the dirty flag."""
+        # Serialize in one pass and hand the file a single buffer;
+        # json.dump issues one write() per token.
+        payload = json_dumps_bytes(self.data, pretty=PRETTY_JSON)
+        self._write_seq += 1
+        self._dirty = False
+        return self._write_seq, payload
+
+    def _store(self, seq, payload):
+        """Write payload to the data file unless a newer snapshot already was."""
+        with self._write_lock:
+            if seq <= self._written_seq:
+                return
+            if payload == self._last_payload:
+                # Same bytes as the file already holds (e.g. a setting set
+                # back to its old value): skip the rewrite
+                self._written_seq = seq
+                return
+            # Write a sibling temp file and swap it in, so a crash mid-write
+            # leaves the previous file intact instead of a truncated one.
+            # The fsync runs here, off the UI thread for deferred saves.
+            tmp = self.filepath.with_name(self.filepath.name + ".tmp")
+            try:
+                with open(tmp, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, self.filepath)
+            except BaseException:
+                # Don't leave a half-written temp file next to the data file
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+                raise
+            self._written_seq = seq
+            self._last_payload = payload
+
+    def _enqueue_write(self, seq, payload):
+        """Hand a snapshot to the writer thread, replacing any still waiting."""
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._writer_loop, name="coursemate-writer", daemon=True)
+            self._writer.start()
+        while True:
+            try:
+                self._write_queue.put_nowait((seq, payload))
+                return
+            except queue.Full:
+                # An older snapshot hasn't been picked up yet; the new one
+                # supersedes it
+                try:
+                    self._write_queue.get_nowait()
+                    self._write_queue.task_done()
+                except queue.Empty:
+                    pass
+
+    def _writer_loop(self):
+        while True:
+            seq, payload = self._write_queue.get()
+            try:
+                self._store(seq, payload)
+            except Exception as e:
+                # No Tk calls off the main thread: _check_background_write
+                # schedules the retry there, and the flush on close reports
+                # an error that persists.
+                print(f"Error saving data: {e}")
+                self._dirty = True
+                self._write_failed = True
+            finally:
+                self._write_queue.task_done()
+
+    def _write_file(self):
         try:
-            with open(self.filepath, 'w') as f:
-                json.dump(self.data, f, indent=2)
+            self._store(*self._snapshot())
         except Exception as e:
+            self._dirty = True
             print(f"Error saving data: {e}")
             messagebox.showerror("Save Error", f"Could not save data: {e}")
 
+    def export(self, path):
+        """Write an indented copy of all data to path (for backups or reading)."""
+        with open(path, 'wb') as f:
+            f.write(json_dumps_bytes(self.data, pretty=True))
+
+    def _commit_change(self):
+        """Record a mutation and schedule its save (at the end of the current batch())."""
+        self._dirty = True
+        self._version += 1
+        if self._batch_depth == 0:
+            self._schedule_write()
+
+    @contextmanager
+    def batch(self):
+        """Group several mutations into a single write of the data file.
+
+        Usage:
+            with data_manager.batch():
+                data_manager.add_unassigned_note(a)
+                data_manager.add_unassigned_note(b)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._schedule_write()
+
+    def _rebuild_code_index(self):
+        """Rebuild the casefolded course-code map used for uniqueness checks."""
+        self._code_index = {nb.get("code", "").casefold(): nb.get("code", "") for nb in self.data["notebooks"].values()}
+
+    def _adjust_counts(self, notebooks=0, notes=0):
+        """Apply a known change to the cached totals (no-op if not yet counted)."""
+        if self._counts is not None:
+            self._counts = (self._counts[0] + notebooks, self._counts[1] + notes)
+
     # --- Helper Accessors ---
+    @property
+    def version(self):
+        """Counter that changes whenever the data may have changed.
+
+        Views can cache anything derived from the data together with this
+        value and reuse it while the version is the same.
+        """
+        return self._version
+
+    def get_counts(self):
+        """Return (notebook_count, note_count) in O(1).
+
+        DataManager mutators keep the totals current; an external save_data
+        (views editing lists in place) forces one recount.
+        """
+        if self._counts is None:
+            notebooks = self.data["notebooks"]
+            notes_count = sum(len(nb.get('notes', [])) for nb in notebooks.values())
+            notes_count += len(self.data["unassigned_notes"])
+            self._counts = (len(notebooks), notes_count)
+        return self._counts
+
     def get_notebooks(self):
         return self.data["notebooks"]
 
@@ -685,19 +1163,48 @@ class DataManager:
         return self.data["settings"]
     
     def update_setting(self, key, value):
-        self.data["settings"][key] = value
-        self.save_data()
+        settings = self.data["settings"]
+        current = settings.get(key, _MISSING)
+        # Skip the write when a view re-sends an unchanged value. A list or
+        # dict handed back as the same object may have been edited in place
+        # (quotes and template dicts are), so those always save.
+        edited_in_place = current is value and isinstance(value, (list, dict))
+        if current == value and not edited_in_place:
+            return
+        settings[key] = value
+        self._commit_change()
+
+    def mutate_setting(self, key, fn, default=list):
+        """Apply fn to setting key's live value (created with default() if
+        missing), schedule a save and return fn's result.
+
+        Usage:
+            data_manager.mutate_setting("quotes", lambda qs: qs.append(quote))
+        """
+        settings = self.data["settings"]
+        value = settings.get(key)
+        if value is None:
+            value = settings[key] = default()
+        result = fn(value)
+        self._commit_change()
+        return result
 
     def add_unassigned_note(self, note):
         self.data["unassigned_notes"].append(note)
-        self.save_data()
+        self._index_notes((note,), self.data["unassigned_notes"])
+        self._index_titles(None, (note,))
+        self._adjust_counts(notes=1)
+        self._commit_change()
 
     def add_note_to_notebook(self, notebook_name, note):
         # Find notebook by name and add note
         for code, nb_data in self.data["notebooks"].items():
             if nb_data.get("name") == notebook_name:
                 nb_data["notes"].append(note)
-                self.save_data()
+                self._index_notes((note,), nb_data["notes"])
+                self._index_titles(notebook_name, (note,))
+                self._adjust_counts(notes=1)
+                self._commit_change()
                 break
 
     def add_notebook(self, name, code="", instructor=""):
@@ -706,17 +1213,28 @@ class DataManager:
             return False, "Course code is required."
         
         code = code.strip()
-        existing_codes = [nb.get("code", "").lower() for nb in self.data["notebooks"].values()]
-        if code.lower() in existing_codes:
-            return False, "A notebook with this course code already exists."
+        existing = self._code_index.get(code.casefold())
+        if existing is not None:
+            return False, f"A notebook with course code '{existing}' already exists."
         
         # Name can be duplicate as long as course code is unique
+        replaced = self.data["notebooks"].get(name)
+        if replaced is None:
+            self._adjust_counts(notebooks=1)
+        else:
+            self._adjust_counts(notes=-len(replaced.get("notes", [])))
+            self._index_notes(replaced.get("notes", []), None)
+            forget_note_derived(replaced.get("notes", []))
+            # The replaced notebook's course code is free to reuse
+            self._code_index.pop(replaced.get("code", "").casefold(), None)
         self.data["notebooks"][name] = {
             "notes": [],
             "code": code,
             "instructor": instructor
         }
-        self.save_data()
+        self._code_index[code.casefold()] = code
+        self._title_index.pop(name, None)
+        self._commit_change()
         return True, "Notebook created successfully."
 
     def rename_notebook(self, old_name, new_name):
@@ -724,7 +1242,9 @@ class DataManager:
         for code, nb_data in self.data["notebooks"].items():
             if nb_data.get("name") == old_name:
                 nb_data["name"] = new_name
-                self.save_data()
+                self._title_index.pop(old_name, None)
+                self._title_index.pop(new_name, None)
+                self._commit_change()
                 return True
         return False
 
@@ -733,15 +1253,63 @@ class DataManager:
         for code, nb_data in list(self.data["notebooks"].items()):
             if nb_data.get("name") == name:
                 del self.data["notebooks"][code]
-                self.save_data()
+                self._code_index.pop(nb_data.get("code", "").casefold(), None)
+                self._title_index.pop(name, None)
+                self._index_notes(nb_data.get("notes", []), None)
+                forget_note_derived(nb_data.get("notes", []))
+                self._adjust_counts(notebooks=-1, notes=-len(nb_data.get("notes", [])))
+                self._commit_change()
                 return True
         return False
 
+    def update_notebook(self, original_key, name, code, instructor=""):
+        """Edit a notebook's name, course code and instructor.
+
+        The notebook is re-keyed under the new code when it changes.
+        Returns (success, message) like add_notebook.
+        """
+        notebooks = self.data["notebooks"]
+        nb_data = notebooks.get(original_key)
+        if nb_data is None:
+            return False, "Notebook not found!"
+        code = code.strip()
+        old_code = nb_data.get("code", "").casefold()
+        existing = self._code_index.get(code.casefold())
+        if code.casefold() != old_code and (existing is not None or code in notebooks):
+            return False, f"A notebook with course code '{existing or code}' already exists."
+        self._title_index.pop(nb_data.get("name"), None)
+        self._title_index.pop(name, None)
+        nb_data["name"] = name
+        nb_data["code"] = code
+        nb_data["instructor"] = instructor
+        if code != original_key:
+            notebooks[code] = nb_data
+            del notebooks[original_key]
+        self._code_index.pop(old_code, None)
+        self._code_index[code.casefold()] = code
+        self._commit_change()
+        return True, "Notebook changes saved."
+
     def note_exists(self, notebook_name, title):
-        # Check unassigned
+        # Case-insensitive title check against a cached per-notebook set
         if notebook_name is None or notebook_name == "• Unassigned Notes" or notebook_name == "Unassigned Notes":
+            notebook_name = None
+        titles = self._title_index.get(notebook_name)
+        if titles is None:
+            titles = self._build_title_set(notebook_name)
+            if titles is None:
+                return False
+            self._title_index[notebook_name] = titles
+        return title.casefold() in titles
+
+    def _build_title_set(self, notebook_name):
+        """Casefolded title counts in a notebook (None = unassigned), or None if not found.
+
+        Counts rather than a plain set, so deleting one of two notes with
+        the same title keeps the other one indexed.
+        """
+        if notebook_name is None:
             notes = self.data["unassigned_notes"]
-        # Check assigned notebooks (find by name)
         else:
             notes = None
             for code, nb_data in self.data["notebooks"].items():
@@ -749,21 +1317,83 @@ class DataManager:
                     notes = nb_data["notes"]
                     break
             if notes is None:
-                return False
-        
-        # Case-insensitive title check
+                return None
+        return Counter(note.get("title", "").casefold() for note in notes)
+
+    def _index_titles(self, notebook_name, notes, delta=1):
+        """Add (or with delta=-1 remove) notes' titles in a built title set."""
+        titles = self._title_index.get(notebook_name)
+        if titles is None:
+            return  # not built yet; note_exists builds it from the data
         for note in notes:
-            if note.get("title", "").lower() == title.lower():
-                return True
-        return False
+            key = note.get("title", "").casefold()
+            titles[key] += delta
+            if titles[key] <= 0:
+                del titles[key]
+
+    def _note_list_for(self, note_id):
+        """Return the list (notebook or unassigned) holding note_id, or None."""
+        if self._note_index is None:
+            index = {}
+            for nb_data in self.data["notebooks"].values():
+                notes = nb_data.get("notes", [])
+                for note in notes:
+                    index[note.get("id")] = notes
+            for note in self.data["unassigned_notes"]:
+                index[note.get("id")] = self.data["unassigned_notes"]
+            index.pop(None, None)
+            self._note_index = index
+        return self._note_index.get(note_id)
+
+    def _index_notes(self, notes, container):
+        """Record notes as held by container (None = removed) in a built id index."""
+        index = self._note_index
+        if index is None:
+            return
+        for note in notes:
+            note_id = note.get("id")
+            if not note_id:
+                continue
+            if container is None:
+                index.pop(note_id, None)
+            else:
+                index[note_id] = container
+
+    @staticmethod
+    def _position_in(notes, note_id):
+        return next(i for i, note in enumerate(notes) if note.get("id") == note_id)
+
+    def _notes_of(self, notebook_name):
+        """Notes list of the notebook named notebook_name, or None."""
+        for nb_data in self.data["notebooks"].values():
+            if nb_data.get("name") == notebook_name:
+                return nb_data["notes"]
+        return None
+
+    def delete_note_by_id(self, note_id):
+        """Remove the note with note_id wherever it is. Returns True if found."""
+        notes = self._note_list_for(note_id)
+        if notes is None:
+            return False
+        forget_note_derived((notes.pop(self._position_in(notes, note_id)),))
+        self._note_index.pop(note_id, None)
+        # Title sets are keyed by notebook name; drop whichever held it
+        self._title_index.clear()
+        self._adjust_counts(notes=-1)
+        self._commit_change()
+        return True
 
     def delete_note(self, notebook_name, note_index):
         # Find notebook by name and delete note
         for code, nb_data in self.data["notebooks"].items():
             if nb_data.get("name") == notebook_name:
                 if 0 <= note_index < len(nb_data["notes"]):
-                    nb_data["notes"].pop(note_index)
-                    self.save_data()
+                    removed = nb_data["notes"].pop(note_index)
+                    forget_note_derived((removed,))
+                    self._index_notes((removed,), None)
+                    self._index_titles(notebook_name, (removed,), -1)
+                    self._adjust_counts(notes=-1)
+                    self._commit_change()
                     return True
                 break
         return False
@@ -781,19 +1411,15 @@ class CourseMate(ctk.CTk):
         super().__init__()
         
         # Data Setup
-        # Data Setup
+        # Loaded on the main thread: the UI needs the settings right away,
+        # and a failed first save shows a messagebox, which must come from Tk's thread
         self.data_manager = DataManager()
-        self.load_custom_fonts()
-        
-        # ...existing initialization continues (no app-level tag UI here)
-        
-        self.current_theme = self.data_manager.get_settings()["theme"]
-        self.colors = THEMES.get(self.current_theme, THEMES['CourseMate Theme'])
-        
-        # Font State
-        self.font_family = self.data_manager.get_settings().get("font_family", "Open Sans")
-        self.font_size_mode = self.data_manager.get_settings().get("font_size", "Normal")
-        self.base_font_size = 14 if self.font_size_mode == "Normal" else 18
+        # Bundled fonts are only registered on Windows. Do that off the main
+        # thread; it only has to finish before the first widget is drawn.
+        self._font_loader = None
+        if sys.platform == "win32" and not CourseMate._fonts_loaded:
+            self._font_loader = threading.Thread(target=self.load_custom_fonts, daemon=True)
+            self._font_loader.start()
         
         # Window Setup
         self.title("CourseMate: Template-Based Note-Taking & Study Aid For Students")
@@ -802,49 +1428,8 @@ class CourseMate(ctk.CTk):
         ctk.set_appearance_mode("System")
 
         # --- Window Icon ---
-        # Attempt to load an application icon from assets/icons.
-        # Prefer .ico on Windows (taskbar/alt-tab), but fall back to PNG if present.
-        try:
-            icon_dir = os.path.join(os.path.dirname(__file__), "assets", "icons")
-            candidates = ["app.ico", "icon.ico", "app.png", "icon.png"]
-            for ico_name in candidates:
-                ico_path = os.path.join(icon_dir, ico_name)
-                if os.path.exists(ico_path):
-                    try:
-                        if ico_path.lower().endswith('.ico'):
-                            # iconbitmap is the most reliable on Windows for titlebar/taskbar icons
-                            try:
-                                self.iconbitmap(ico_path)
-                            except Exception:
-                                # Fallback to PhotoImage if iconbitmap fails for any reason
-                                try:
-                                    img = tk.PhotoImage(file=ico_path)
-                                    # Set as default icon for all toplevels and keep a reference
-                                    try:
-                                        self.iconphoto(True, img)
-                                    except Exception:
-                                        self.iconphoto(False, img)
-                                    self._icon_image = img
-                                except Exception:
-                                    print(f"Failed to load icon (ico fallback): {ico_path}")
-                        else:
-                            # Use PhotoImage for PNGs (keep a reference to avoid GC)
-                            try:
-                                img = tk.PhotoImage(file=ico_path)
-                                # Use True so it applies to all toplevel windows
-                                try:
-                                    self.iconphoto(True, img)
-                                except Exception:
-                                    self.iconphoto(False, img)
-                                self._icon_image = img
-                            except Exception:
-                                print(f"Failed to load icon (png): {ico_path}")
-                    except Exception as e:
-                        # Ignore icon loading problems; non-fatal but log for debugging
-                        print(f"Icon load error: {e}")
-                    break
-        except Exception as e:
-            print(f"Icon setup unexpected error: {e}")
+        # Not needed for the first paint; set it once the event loop is idle.
+        self.after_idle(self._setup_icon)
 
         # Start maximized on Windows after initial layout completes and provide fullscreen toggle (F11) + Escape to exit
         def _maximize_after_startup():
@@ -869,6 +1454,8 @@ class CourseMate(ctk.CTk):
         # F11 toggles fullscreen, Escape exits fullscreen
         self.bind('<F11>', _toggle_fullscreen)
         self.bind('<Escape>', lambda e: (self.attributes('-fullscreen', False), setattr(self, '_is_fullscreen', False)))
+
+        self._setup_data()
         
         # Layout Setup
         self.grid_columnconfigure(0, weight=0)
@@ -878,13 +1465,76 @@ class CourseMate(ctk.CTk):
         
         self.sidebar = None
         self.main_area = None
+        self.current_view = None
+        self._pending_refresh = set()  # see schedule_refresh
+        self.settings_open_sections = set()  # see SettingsView._lazy_section
         
+        if self._font_loader is not None:
+            self._font_loader.join()
         self._init_ui()
         #Deafult view
         # self.show_settings()
         self.show_home() 
 
 
+    # Decoded window icon, shared by every CourseMate window on the same Tk interpreter
+    _shared_icon = None
+
+    def _setup_icon(self):
+        """Set the window icon from assets/icons (see _resolve_icon_path)."""
+        try:
+            ico_path = _resolve_icon_path()
+            if ico_path is None:
+                return
+            if ico_path.lower().endswith('.ico'):
+                # iconbitmap is the most reliable on Windows for titlebar/taskbar icons
+                try:
+                    self.iconbitmap(ico_path)
+                    return
+                except Exception:
+                    # Fall back to PhotoImage if iconbitmap fails for any reason
+                    pass
+            img = CourseMate._shared_icon
+            if img is None or img.tk is not self.tk:
+                try:
+                    img = tk.PhotoImage(file=ico_path)
+                except Exception:
+                    print(f"Failed to load icon: {ico_path}")
+                    return
+                # Class-level reference keeps the image alive (avoids GC)
+                CourseMate._shared_icon = img
+            # Use True so it applies to all toplevel windows
+            try:
+                self.iconphoto(True, img)
+            except Exception:
+                self.iconphoto(False, img)
+        except Exception as e:
+            # Ignore icon loading problems; non-fatal but log for debugging
+            print(f"Icon setup unexpected error: {e}")
+
+    def _setup_data(self):
+        """Read theme and font state from the settings and hook up saving.
+
+        Deferred saves are timed on this window's event loop and flushed
+        when it is closed.
+        """
+        settings = self.data_manager.get_settings()
+        self.current_theme = settings["theme"]
+        self.colors = THEMES.get(self.current_theme, THEMES['CourseMate Theme'])
+        
+        # Font State
+        self.font_family = settings.get("font_family", "Open Sans")
+        self.font_size_mode = settings.get("font_size", "Normal")
+        self.base_font_size = 14 if self.font_size_mode == "Normal" else 18
+        self._font_cache = {}
+        self.data_manager.attach_scheduler(self)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        """Write any deferred changes before the window goes away."""
+        self.data_manager.flush(wait=True)
+        self.destroy()
+
     def _init_ui(self):
         # Header (top, spans sidebar + main area)
         self.header = ctk.CTkFrame(self, fg_color=self.colors['header_bg'], corner_radius=0)
@@ -925,9 +1575,37 @@ class CourseMate(ctk.CTk):
         self.main_area = ctk.CTkFrame(self, fg_color=self.colors['background'], corner_radius=0)
         self.main_area.grid(row=1, column=1, sticky="nsew")
 
+    def schedule_refresh(self, *kinds):
+        """Queue UI refreshes and run them together once Tk is idle.
+
+        kinds: 'stats' (header counts) and/or 'notes' (Home notes list).
+        Several requests before the next idle pass collapse into one.
+        """
+        if not self._pending_refresh:
+            self.after_idle(self._run_pending_refresh)
+        self._pending_refresh.update(kinds)
+
+    def _run_pending_refresh(self):
+        kinds, self._pending_refresh = self._pending_refresh, set()
+        if 'stats' in kinds and self.sidebar is not None:
+            self.sidebar.refresh_stats()
+        if 'notes' in kinds and isinstance(self.current_view, HomeView):
+            try:
+                self.current_view.refresh_notes_list()
+            except Exception:
+                pass  # view was torn down between scheduling and idle
+
     def clear_main_area(self):
-        for widget in self.main_area.winfo_children():
-            widget.destroy()
+        # Swap in a fresh frame and destroy the old one with its whole subtree
+        # in one go, rather than destroying (and re-laying-out) child by child.
+        old_area = self.main_area
+        self.main_area = ctk.CTkFrame(self, fg_color=self.colors['background'], corner_radius=0)
+        self.main_area.grid(row=1, column=1, sticky="nsew")
+        old_area.destroy()
+        # The inspiration overlay lived inside the old frame
+        self._inspiration_overlay = None
+        if self.sidebar is not None:
+            self.sidebar._stop_quote_timer()
 
     def show_home(self):
         self.clear_main_area()
@@ -939,39 +1617,36 @@ class CourseMate(ctk.CTk):
 
     def show_settings(self):
         self.clear_main_area()
-        self.current_view = SettingsView(self.main_area, self.data_manager, self.colors)
+        self.current_view = SettingsView(self.main_area, self.data_manager, self.colors, app=self)
 
     def show_about(self):
         """Show the About CourseMate page."""
         self.clear_main_area()
-        self.current_view = AboutView(self.main_area, self.data_manager, self.colors)
+        self.current_view = AboutView(self.main_area, self.data_manager, self.colors, app=self)
+
+    # Set once the bundled fonts are registered for this process
+    _fonts_loaded = False
 
     def load_custom_fonts(self):
-        # Load fonts from assets/fonts
-        font_dir = os.path.join(os.path.dirname(__file__), "assets", "fonts")
-        if not os.path.exists(font_dir):
+        # Load fonts from assets/fonts (once per process)
+        if CourseMate._fonts_loaded or sys.platform != "win32":
+            # On Linux/Mac, fonts need to be installed system-wide or tkinter uses system fonts
+            return
+        font_paths = _custom_font_paths()
+        if not font_paths:
             return
 
-        # Platform-specific font loading
-        import platform
-        system = platform.system()
-        
-        if system == "Windows":
-            try:
-                gdi32 = ctypes.windll.gdi32
-                for font_file in os.listdir(font_dir):
-                    if font_file.lower().endswith((".ttf", ".otf")):
-                        font_path = os.path.join(font_dir, font_file)
-                        ret = gdi32.AddFontResourceExW(font_path, 0x10, 0) # FR_PRIVATE = 0x10
-                        if ret == 0:
-                            print(f"Failed to load font: {font_file}")
-                        else:
-                            print(f"Loaded font: {font_file}")
-            except Exception as e:
-                print(f"Font loading error: {e}")
-        else:
-            # On Linux/Mac, fonts need to be installed system-wide or tkinter uses system fonts
-            print(f"Custom font loading not implemented for {system}. Using system fonts.")
+        try:
+            add_font = ctypes.windll.gdi32.AddFontResourceExW
+            for font_path in font_paths:
+                ret = add_font(font_path, 0x10, 0) # FR_PRIVATE = 0x10
+                if ret == 0:
+                    print(f"Failed to load font: {os.path.basename(font_path)}")
+                elif DEBUG:
+                    print(f"Loaded font: {os.path.basename(font_path)}")
+            CourseMate._fonts_loaded = True
+        except Exception as e:
+            print(f"Font loading error: {e}")
 
     def get_font(self, size_offset=0, weight="normal", slant="roman"):
         """Return a font tuple applying adaptive scaling.
@@ -979,7 +1654,14 @@ class CourseMate(ctk.CTk):
         OpenDyslexic renders visually larger at the same point size; apply
         a reduction factor so normal and large modes remain readable and
         avoid overflow in compact UI areas (e.g., inspiration section).
+
+        Tuples are cached per (size_offset, weight, slant); apply_settings
+        clears the cache when the font family or size changes.
         """
+        key = (size_offset, weight, slant)
+        font = self._font_cache.get(key)
+        if font is not None:
+            return font
         size = self.base_font_size + size_offset
         try:
             if self.font_family.lower().startswith("opendyslexic"):
@@ -987,7 +1669,8 @@ class CourseMate(ctk.CTk):
                 size = max(8, int(round(size * 0.85)))
         except Exception:
             pass
-        return (self.font_family, size, weight, slant)
+        font = self._font_cache[key] = (self.font_family, size, weight, slant)
+        return font
 
     def apply_settings(self):
         settings = self.data_manager.get_settings()
@@ -1000,18 +1683,16 @@ class CourseMate(ctk.CTk):
             # No icon cache to clear - icons are loaded fresh each time
         
         # Update Font
-        self.font_family = settings.get("font_family", "Open Sans")
-        self.font_size_mode = settings.get("font_size", "Normal")
+        font_family = settings.get("font_family", "Open Sans")
+        font_size_mode = settings.get("font_size", "Normal")
+        if font_family != self.font_family or font_size_mode != self.font_size_mode:
+            self._font_cache = {}
+        self.font_family = font_family
+        self.font_size_mode = font_size_mode
         self.base_font_size = 14 if self.font_size_mode == "Normal" else 18
         
-        # Preserve current active page before destroying sidebar
-        current_active_page = self.sidebar.active_page if self.sidebar else "Home"
-        
-        # Update Sidebar (keep it in row 1 so header stays in row 0)
-        self.sidebar.destroy()
-        self.sidebar = Sidebar(self, self.data_manager, self.colors, self.show_home, self.show_notebooks, self.show_settings, about_cb=self.show_about, initial_page=current_active_page)
-        self.sidebar.grid(row=1, column=0, sticky="nsew")
-        self.sidebar.refresh_stats()
+        # Restyle the sidebar in place (no destroy/rebuild of its buttons)
+        self.sidebar.apply_theme(self.colors)
         
         # Update Main Area Background
         self.main_area.configure(fg_color=self.colors['background'])
@@ -1089,9 +1770,7 @@ class CourseMate(ctk.CTk):
         self.apply_settings()   
 
     def truncate_text(self, text, limit=25):
-        if len(text) > limit:
-            return text[:limit-3] + "..."
-        return text
+        return truncate_label(text, limit)
 
     def _update_header_fonts(self):
         try:
@@ -1140,6 +1819,12 @@ class Sidebar(ctk.CTkFrame):
         self.nav_buttons = {}
         self._inspiration_overlay = None
         self._current_quote = None
+        self._quote_deck = []            # shuffled quotes still to show this round
+        self._quote_deck_version = None  # DataManager.version the deck was dealt at
+        self._last_counts = None  # header stats last written by refresh_stats
+        self._quote_label = None     # quote label in the open inspiration overlay
+        self._quote_after_id = None  # pending quote rotation (only while shown)
+        self._quote_interval_ms = self._read_quote_interval()
 
         # Create top navigation icon stack
         self.nav_frame = ctk.CTkFrame(self, fg_color="transparent", width=56)
@@ -1171,6 +1856,7 @@ class Sidebar(ctk.CTkFrame):
             return
         # If overlay exists, destroy it
         if hasattr(app, '_inspiration_overlay') and app._inspiration_overlay is not None:
+            self._stop_quote_timer()
             try:
                 app._inspiration_overlay.destroy()
             except Exception:
@@ -1213,15 +1899,68 @@ class Sidebar(ctk.CTkFrame):
         drag_label.bind('<B1-Motion>', on_drag)
 
         app._inspiration_overlay = overlay
+        self._quote_label = label
+        self._start_quote_timer()
+
+    def _start_quote_timer(self):
+        """Rotate the overlay quote every `quote_timer` seconds while it is shown.
+
+        Restarting cancels the pending tick first, so there is never more
+        than one rotation scheduled.
+        """
+        self._stop_quote_timer()
+        self._quote_after_id = self.after(self._quote_interval_ms, self._quote_tick)
+
+    def _read_quote_interval(self):
+        """The `quote_timer` setting in milliseconds, clamped to the allowed range."""
+        try:
+            seconds = int(self.data_manager.get_settings().get("quote_timer", 30))
+        except (TypeError, ValueError):
+            seconds = 30
+        return min(max(QUOTE_TIMER_MIN, seconds), QUOTE_TIMER_MAX) * 1000
+
+    def set_quote_interval(self, seconds):
+        """Use a new rotation interval, re-arming the timer if it is running."""
+        self._quote_interval_ms = min(max(QUOTE_TIMER_MIN, int(seconds)), QUOTE_TIMER_MAX) * 1000
+        if self._quote_after_id is not None:
+            self._start_quote_timer()
+
+    def _stop_quote_timer(self):
+        if self._quote_after_id is not None:
+            try:
+                self.after_cancel(self._quote_after_id)
+            except Exception:
+                pass
+            self._quote_after_id = None
+
+    def _quote_tick(self):
+        self._quote_after_id = None
+        label = self._quote_label
+        # The overlay lives in the main area; it is gone after a view switch
+        if label is None or not label.winfo_exists():
+            self._quote_label = None
+            return
+        label.configure(text=self._get_inspiration_quote())
+        self._quote_after_id = self.after(self._quote_interval_ms, self._quote_tick)
 
     def _get_inspiration_quote(self):
-        # Get a random quote from settings
-        settings = self.data_manager.get_settings()
-        quotes = settings.get("quotes", [])
-        import random
-        if quotes:
-            return random.choice(quotes)
-        return "Stay motivated!"
+        # Deal quotes from a shuffled deck: each tick is a pop, and every
+        # quote shows once per round. The deck is re-dealt when it runs out
+        # or the data changed (quotes are edited in place).
+        version = self.data_manager.version
+        if not self._quote_deck or version != self._quote_deck_version:
+            quotes = self.data_manager.get_settings().get("quotes", [])
+            if not quotes:
+                return "Stay motivated!"
+            deck = list(quotes)
+            random.shuffle(deck)
+            if len(deck) > 1 and deck[-1] == self._current_quote:
+                # Avoid an immediate repeat across rounds
+                deck[0], deck[-1] = deck[-1], deck[0]
+            self._quote_deck = deck
+            self._quote_deck_version = version
+        quote = self._current_quote = self._quote_deck.pop()
+        return quote
 
     def _wrap_callback(self, callback, page_name):
         def _wrapped():
@@ -1294,15 +2033,27 @@ class Sidebar(ctk.CTkFrame):
             'set_active': set_active
         }
 
+    def apply_theme(self, colors):
+        """Restyle the existing sidebar widgets for a new theme or font size."""
+        self.colors = colors
+        self.configure(fg_color=colors['sidebar_bg'])
+        bg_color = colors.get('sidebar_button', '#334a66')
+        hover_color = colors.get('sidebar_hover', '#405977')
+        text_font = self.master.get_font(-1, "bold")
+        for btn_info in self.nav_buttons.values():
+            btn = btn_info['button']
+            btn.configure(fg_color=bg_color, hover_color=hover_color)
+            if not btn_info['image']:
+                # Text fallback buttons also follow the font setting
+                btn.configure(font=text_font)
+
     def refresh_stats(self):
-        # Get notebooks dict from DataManager
-        notebooks = self.data_manager.get_notebooks()
-        # Count notebooks (keys in dict)
-        notebook_count = len(notebooks)
-        # Count notes in all notebooks
-        notes_count = sum(len(nb.get('notes', [])) for nb in notebooks.values())
-        # Add unassigned notes
-        notes_count += len(self.data_manager.get_unassigned_notes())
+        # Notebook and note totals (cached by DataManager between changes)
+        counts = self.data_manager.get_counts()
+        if counts == self._last_counts:
+            return  # labels already show these numbers
+        self._last_counts = counts
+        notebook_count, notes_count = counts
 
         # Update header overlay labels if present (overlay lives on the App instance)
         app = getattr(self, 'master', None)
@@ -1405,12 +2156,14 @@ class LoadingDialog(ctk.CTkToplevel):
 
 
 class TemplateDialog(ctk.CTkToplevel):
-    """Modal dialog for creating or editing a user template."""
-    def __init__(self, master, title_init="", structure_init="", on_save=None, is_edit=False, insert_mode=False):
+    """Modal dialog for creating or editing a user template.
+
+    Use TemplateDialog.open(...) to reuse one hidden instance per app
+    instead of building a new window each time.
+    """
+    def __init__(self, master, title_init="", structure_init="", on_save=None, is_edit=False, insert_mode=False, pooled=False):
         super().__init__(master)
-        self.on_save = on_save
-        self.is_edit = is_edit
-        self.insert_mode = insert_mode  # Insert mode for template content
+        self._pooled = pooled  # hide instead of destroy when closed
         self.title("Template Editor")
         self.geometry("480x400")
         # Safely get colors from the app instance before any widget creation
@@ -1419,41 +2172,78 @@ class TemplateDialog(ctk.CTkToplevel):
         self.resizable(False, False)
         try:
             self.transient(master)
-            self.grab_set()
+            if not pooled:
+                self.grab_set()
         except Exception:
             pass
         
         # Get app instance for font access
-        app = self._get_app_instance(master)
         font_normal = app.get_font(-2) if app else ("Open Sans", 12)
         font_bold = app.get_font(-2, "bold") if app else ("Open Sans", 12, "bold")
 
         ctk.CTkLabel(self, text="Template title:", font=font_bold).pack(anchor="w", padx=16, pady=(12, 4))
-        self.title_entry = ctk.CTkEntry(self, placeholder_text="Enter template title", font=font_normal,
-                         fg_color=self.colors.get('card_bg', self.colors['background']),
-                         text_color=self.colors['main_text'])
+        self.title_entry = ctk.CTkEntry(self, placeholder_text="Enter template title", font=font_normal)
         self.title_entry.pack(fill="x", padx=16, pady=(0, 8))
-        # Validation bindings for template title (single line + length)
-        try:
-            self.title_entry.bind("<KeyRelease>", self._validate_title_live)
-            self.title_entry.bind("<Return>", self._on_title_return)
-            self.title_entry.bind("<FocusOut>", self._validate_title_on_blur)
-        except Exception:
-            pass
-        self.title_entry.insert(0, title_init)
 
         ctk.CTkLabel(self, text="Template structure:", font=font_bold).pack(anchor="w", padx=16, pady=(0, 4))
-        self.structure_text = ctk.CTkTextbox(self, font=font_normal, height=200,
-                              fg_color=self.colors.get('background', '#ffffff'),
-                              text_color=self.colors['main_text'])
+        self.structure_text = ctk.CTkTextbox(self, font=font_normal, height=200)
         self.structure_text.pack(fill="both", expand=True, padx=16, pady=(0, 8))
-        self.structure_text.insert("1.0", structure_init)
 
         btn_frame = ctk.CTkFrame(self, fg_color="transparent")
         btn_frame.pack(fill="x", padx=16, pady=(0, 12))
-        ctk.CTkButton(btn_frame, text="Cancel", command=self.destroy).pack(side="right", padx=(8, 0))
-        save_text = "Insert" if self.insert_mode else "Save"
-        ctk.CTkButton(btn_frame, text=save_text, command=self._on_save).pack(side="right", padx=(0, 8))
+        ctk.CTkButton(btn_frame, text="Cancel", command=self._close).pack(side="right", padx=(8, 0))
+        self.save_btn = ctk.CTkButton(btn_frame, text="Save", command=self._on_save)
+        self.save_btn.pack(side="right", padx=(0, 8))
+        self.protocol("WM_DELETE_WINDOW", self._close)
+
+        self._load(self.colors, title_init, structure_init, on_save, is_edit, insert_mode)
+
+    @classmethod
+    def open(cls, master, title_init="", structure_init="", on_save=None, is_edit=False, insert_mode=False):
+        """Show the app's shared template dialog, creating it on first use."""
+        app = cls._get_app_instance(master)
+        owner = app or master
+        dlg = getattr(owner, '_template_dialog', None)
+        if dlg is None or not dlg.winfo_exists():
+            dlg = cls(owner, title_init, structure_init, on_save, is_edit, insert_mode, pooled=True)
+            owner._template_dialog = dlg
+        else:
+            colors = getattr(app, 'colors', THEMES['CourseMate Theme'])
+            dlg._load(colors, title_init, structure_init, on_save, is_edit, insert_mode)
+            dlg.deiconify()
+            dlg.lift()
+        try:
+            dlg.grab_set()
+        except Exception:
+            pass
+        return dlg
+
+    def _load(self, colors, title_init, structure_init, on_save, is_edit, insert_mode):
+        """Reset the fields and callback for a new edit session."""
+        self.on_save = on_save
+        self.is_edit = is_edit
+        self.insert_mode = insert_mode  # Insert mode for template content
+        self.colors = colors
+        self.title_entry.configure(fg_color=colors.get('card_bg', colors['background']),
+                                   text_color=colors['main_text'])
+        self.structure_text.configure(fg_color=colors.get('background', '#ffffff'),
+                                      text_color=colors['main_text'])
+        self.title_entry.delete(0, "end")
+        self.title_entry.insert(0, title_init)
+        self.structure_text.delete("1.0", "end")
+        self.structure_text.insert("1.0", structure_init)
+        self.save_btn.configure(text="Insert" if insert_mode else "Save")
+
+    def _close(self):
+        try:
+            self.grab_release()
+        except Exception:
+            pass
+        if self._pooled:
+            self.on_save = None  # don't keep the caller's closure alive
+            self.withdraw()
+        else:
+            self.destroy()
 
     def _on_save(self):
         title = self.title_entry.get().strip()
@@ -1480,9 +2270,10 @@ class TemplateDialog(ctk.CTkToplevel):
                 except Exception as e:
                     messagebox.showerror("Error", str(e))
                     return
-        self.destroy()
+        self._close()
     
-    def _get_app_instance(self, widget):
+    @staticmethod
+    def _get_app_instance(widget):
         """Walk up widget hierarchy to find CourseMate app instance."""
         try:
             current = widget
@@ -1497,59 +2288,102 @@ class TemplateDialog(ctk.CTkToplevel):
 
 # Small modal dialog for input (replaces simpledialog.askstring)
 class InputDialog(ctk.CTkToplevel):
-    """Generic single-field input dialog used in place of simpledialog.askstring."""
-    def __init__(self, master, title, prompt, initialvalue=""):
+    """Generic single-field input dialog used in place of simpledialog.askstring.
+
+    InputDialog.ask(...) reuses one hidden instance per app and returns the
+    entered text, or None if cancelled.
+    """
+    def __init__(self, master, title, prompt, initialvalue="", pooled=False):
         super().__init__(master)
-        self.title(title)
+        self._pooled = pooled  # hide instead of destroy when closed
         self.geometry("550x150")
         self.resizable(False, False)
         try:
             self.transient(master)
-            self.grab_set()
+            if not pooled:
+                self.grab_set()
         except Exception:
             pass
 
         self.result = None
+        self._done = tk.BooleanVar(self, value=False)
         
         # Get app instance for font access
         app = self._get_app_instance(master)
         font_normal = app.get_font(-3) if app else ("Open Sans", 11)
 
-        ctk.CTkLabel(self, text=prompt, font=font_normal).pack(pady=(20, 10), padx=20, anchor="w")
+        self.prompt_label = ctk.CTkLabel(self, text="", font=font_normal)
+        self.prompt_label.pack(pady=(20, 10), padx=20, anchor="w")
 
-        app = self._get_app_instance(master)
-        colors = getattr(app, 'colors', THEMES['CourseMate Theme'])
-        self.entry = ctk.CTkEntry(self, width=500,
-                       fg_color=colors.get('card_bg', colors['background']),
-                       text_color=colors['main_text'])
+        self.entry = ctk.CTkEntry(self, width=500)
         self.entry.pack(padx=20, pady=(0, 20))
-        self.entry.insert(0, initialvalue)
-        self.entry.focus()
 
         btn_frame = ctk.CTkFrame(self, fg_color="transparent")
         btn_frame.pack(fill="x", padx=20, pady=(0, 20))
 
         ctk.CTkButton(btn_frame, text="OK", width=80, command=self._on_ok).pack(side="right", padx=(6, 0))
-        ctk.CTkButton(btn_frame, text="Cancel", width=80, command=self.destroy).pack(side="right")
+        ctk.CTkButton(btn_frame, text="Cancel", width=80, command=self._on_cancel).pack(side="right")
 
         self.entry.bind("<Return>", lambda e: self._on_ok())
-        self.bind("<Escape>", lambda e: self.destroy())
+        self.bind("<Escape>", lambda e: self._on_cancel())
+        self.protocol("WM_DELETE_WINDOW", self._on_cancel)
+
+        self._load(getattr(app, 'colors', THEMES['CourseMate Theme']), title, prompt, initialvalue)
+
+    @classmethod
+    def ask(cls, master, title, prompt, initialvalue=""):
+        """Show the app's shared input dialog modally and return the entered text (None if cancelled)."""
+        app = cls._get_app_instance(master)
+        owner = app or master
+        dlg = getattr(owner, '_input_dialog', None)
+        if dlg is None or not dlg.winfo_exists():
+            dlg = cls(owner, title, prompt, initialvalue, pooled=True)
+            owner._input_dialog = dlg
+        else:
+            dlg._load(getattr(app, 'colors', THEMES['CourseMate Theme']), title, prompt, initialvalue)
+            dlg.deiconify()
+            dlg.lift()
+        try:
+            dlg.grab_set()
+        except Exception:
+            pass
+        dlg.entry.focus()
+        dlg.wait_variable(dlg._done)
+        return dlg.result
 
-    def _on_ok(self):
-        self.result = self.entry.get().strip()
-        self.destroy()
-    
-    def _get_app_instance(self, widget):
-        """Walk up widget hierarchy to find CourseMate app instance."""
+    def _load(self, colors, title, prompt, initialvalue):
+        """Reset title, prompt and entry text for a new question."""
+        self.title(title)
+        self.result = None
+        self._done.set(False)
+        self.prompt_label.configure(text=prompt)
+        self.entry.configure(fg_color=colors.get('card_bg', colors['background']),
+                             text_color=colors['main_text'])
+        self.entry.delete(0, "end")
+        self.entry.insert(0, initialvalue)
+        self.entry.focus()
+
+    def _finish(self):
         try:
-            current = widget
-            while current:
-                if isinstance(current, CourseMate):
-                    return current
-                current = current.master if hasattr(current, 'master') else None
+            self.grab_release()
         except Exception:
             pass
-        return None
+        self._done.set(True)
+        if self._pooled:
+            self.withdraw()
+        else:
+            self.destroy()
+
+    def _on_ok(self):
+        self.result = self.entry.get().strip()
+        self._finish()
+
+    def _on_cancel(self):
+        self.result = None
+        self._finish()
+    
+    # Same lookup as TemplateDialog; views and dialogs resolve the app once
+    _get_app_instance = TemplateDialog._get_app_instance
 
 
 class HomeView:
@@ -1558,28 +2392,28 @@ class HomeView:
     Provides template insertion, notebook assignment, hashtag-based tagging,
     and plain-text editing with lightweight bullet assistance.
     """
-    # Removed legacy duplicate initialization block.
-    TEMPLATES = {
-        "Cornell Notes": "Title: \n\nQuestion/Keyword\n-\n-\n\nNotes\n-\n-\n\nSummary\n-\n_",
-        "Main Idea & Details": "Main Idea: ___\n\nDetail 1:\n-\n\nDetail 2:\n-\n\nDetail 3:\n-\n\nSummary:\n-",
-        "Modified Frayer Model": "Definition:\n-\n\nCharacteristics:\n-\n\nExamples:\n-\n\nNon-Examples:\n-",
-        "Polya's 4 Steps": "1. Understand the Problem:\n-\n\n2. Devise a Plan:\n-\n\n3. Carry Out the Plan:\n-\n\n4. Look Back:\n-",
-        "5W1H": "Who:\n-\n\nWhat:\n-\n\nWhen:\n-\n\nWhere:\n-\n\nWhy:\n-\n\nHow:\n-",
-        "Concept Map": "Central Concept:\n-\n\nRelated Concept 1:\n-\n\nRelated Concept 2:\n-\n\nConnections:\n-"
-    }
 
     def __init__(self, master, data_manager, colors, app):
         self.master = master
         self.data_manager = data_manager
         self.colors = colors
         self.app = app
+        self._filter_after_id = None  # pending debounced search refresh
+        self._card_pool = []          # reusable note cards, see refresh_notes_list
+        self._card_pool_owner = None  # notes_list the pooled cards belong to
+        self._tab_notes_cache = None  # ((tab, data version), sorted notes)
+        self._card_limit = NOTE_CARD_PAGE_SIZE  # cards shown before "Show more"
+        self._card_limit_key = None   # (tab, search) the limit applies to
+        self._show_more_btn = None
+        self._last_nb_names = None    # notebook names behind the dropdown values
+        self._last_template_name = None  # template inserted last, see _insert_template_from
         
         # Load categorized templates from settings
         settings = data_manager.get_settings()
         study_saved = settings.get("study_templates", {}) or {}
         additional_saved = settings.get("additional_templates", {}) or {}
         # Merge built-in study templates with any saved ones (saved can override built-in by title)
-        self.study_templates = {**self.TEMPLATES, **study_saved}
+        self.study_templates = {**DEFAULT_STUDY_TEMPLATES, **study_saved}
         self.additional_templates = dict(additional_saved)
         # Active category tracking
         self.active_category = "Study"
@@ -1702,13 +2536,17 @@ class HomeView:
         except Exception:
             pass
     def update_notebook_dropdown(self):
+        names = tuple(nb_data.get("name", code) for code, nb_data in self.data_manager.get_notebooks().items())
+        if hasattr(self, 'notebook_dropdown') and names == self._last_nb_names:
+            return  # same notebooks: values and notebook_map are still valid
+        self._last_nb_names = names
+
         # Add bullets to notebook names and truncate
         self.notebook_map = {} # Map display name -> full name
         notebook_list = []
         
-        for code, nb_data in self.data_manager.get_notebooks().items():
-            name = nb_data.get("name", code)
-            display_name = f"• {self.master.master.truncate_text(name)}"
+        for name in names:
+            display_name = f"• {self.app.truncate_text(name)}"
             notebook_list.append(display_name)
             self.notebook_map[display_name] = name
             
@@ -1788,9 +2626,6 @@ class HomeView:
         self.notes_list.pack(fill="both", expand=True)
         self.refresh_notes_list()
 
-    def filter_notes(self, event=None):
-        self.refresh_notes_list()
-
     # NOTE: `refresh_notes_list` was previously defined twice. The canonical
     # implementation lives later in the file; the duplicate earlier version
     # has been removed to avoid accidental overrides.
@@ -1806,12 +2641,7 @@ class HomeView:
             for n in nb_data.get("notes", []):
                 notes.append({**n, "_notebook": nb_data.get("name", nb_name)})
         # Sort by created date (newest first)
-        def get_dt(note):
-            try:
-                return datetime.strptime(note.get('created', ''), "%B %d, %Y | %I:%M%p")
-            except Exception:
-                return datetime.min
-        notes.sort(key=get_dt, reverse=True)
+        notes.sort(key=lambda n: parse_note_datetime(n.get('created', '')), reverse=True)
         return notes[:count]
 
     def _get_assigned_notes(self):
@@ -1820,63 +2650,89 @@ class HomeView:
             for n in nb_data.get("notes", []):
                 notes.append({**n, "_notebook": nb_data.get("name", nb_name)})
         # Sort by created date (newest first)
-        def get_dt(note):
-            try:
-                # Try ISO format first
-                return datetime.fromisoformat(note.get('created', ''))
-            except Exception:
-                try:
-                    return datetime.strptime(note.get('created', ''), "%B %d, %Y | %I:%M%p")
-                except Exception:
-                    return datetime.min
-        notes.sort(key=get_dt, reverse=True)
+        notes.sort(key=lambda n: parse_note_datetime(n.get('created', '')), reverse=True)
         return notes
 
-    def _create_note_card(self, note, tab=None):
+    def _create_note_card(self):
+        """Build an empty note card for the pool; _fill_note_card sets its content.
+
+        Click handlers read the card's current note, so a pooled card can be
+        refilled without rebinding.
+        """
         border_color = self.colors.get('card_border', self.colors.get('muted', '#68707a'))
         corner = 12
+        entry = {'note': None}
+        open_card = partial(self._open_card_note, entry)
         card = ctk.CTkFrame(self.notes_list, fg_color=self.colors['card_bg'], corner_radius=corner, border_width=2, border_color=border_color)
-        card.pack(fill="x", pady=5)
-        card.bind("<Button-1>", lambda e, n=note: self.open_note_window(n))
+        card.bind("<Button-1>", open_card)
         # Hover color change removed
+        lbl_title = ctk.CTkLabel(card, text="", font=self.app.get_font(-1, "bold"), text_color=self.colors['main_text'], anchor="w")
+        lbl_title.pack(fill="x", padx=10, pady=(5, 0))
+        lbl_title.bind("<Button-1>", open_card)
+        lbl_meta = ctk.CTkLabel(card, text="", font=self.app.get_font(-3), text_color=self.colors['secondary_text'], anchor="w")
+        lbl_meta.pack(fill="x", padx=10, pady=(0, 5))
+        lbl_meta.bind("<Button-1>", open_card)
+        # Tags label is packed only for notes that have tags
+        tag_lbl = ctk.CTkLabel(card, text="", font=self.app.get_font(-3, "italic"), text_color=self.colors['accent'], anchor="w")
+        tag_lbl.bind("<Button-1>", open_card)
+        # Add Open Note button
+        btn_open = ctk.CTkButton(card, text="Open Note", command=open_card,
+            fg_color=self.colors.get('button_primary', self.colors['primary']),
+            text_color=self.colors.get('button_text', 'white'),
+            height=30, font=self.app.get_font(-1))
+        btn_open.pack(fill="x", padx=10, pady=(0, 8))
+        entry.update(frame=card, lbl_title=lbl_title, lbl_meta=lbl_meta, tag_lbl=tag_lbl, btn_open=btn_open)
+        return entry
+
+    def _open_card_note(self, entry, event=None):
+        """Shared click handler of a pooled card and its labels."""
+        self.open_note_window(entry['note'])
+
+    def _fill_note_card(self, entry, note, tab=None):
+        """Point a pooled card at note and update its labels."""
+        entry['note'] = note
         title = note.get('title', 'Untitled')
         created_str = note.get('created', '')
         date_str = format_human_date(created_str)
-        content_words = note.get('content', '').split()
-        preview_text = " ".join(content_words[:3]) if content_words else ""
-        lbl_title = ctk.CTkLabel(card, text=title, font=self.app.get_font(-1, "bold"), text_color=self.colors['main_text'], anchor="w")
-        lbl_title.pack(fill="x", padx=10, pady=(5, 0))
-        lbl_title.bind("<Button-1>", lambda e, n=note: self.open_note_window(n))
+        preview_text = note_preview_words(note)
         meta_text = f"{date_str} | {preview_text}"
         if tab in ("Recent", "All"):
             nb_name = note.get('_notebook')
             if nb_name:
                 meta_text += f" | 📒 {nb_name}"
-        lbl_meta = ctk.CTkLabel(card, text=meta_text, font=self.app.get_font(-3), text_color=self.colors['secondary_text'], anchor="w")
-        lbl_meta.pack(fill="x", padx=10, pady=(0, 5))
-        lbl_meta.bind("<Button-1>", lambda e, n=note: self.open_note_window(n))
-        tags = note.get('tags', [])
-        if tags:
-            tags_text = " ".join([f"#{t}" if not t.startswith('#') else t for t in tags])
-            tag_lbl = ctk.CTkLabel(card, text=tags_text, font=self.app.get_font(-3, "italic"), text_color=self.colors['accent'], anchor="w")
-            tag_lbl.pack(fill="x", padx=10, pady=(0, 5))
-            tag_lbl.bind("<Button-1>", lambda e, n=note: self.open_note_window(n))
-        # Add Open Note button
-        ctk.CTkButton(card, text="Open Note", command=lambda n=note: self.open_note_window(n),
-            fg_color=self.colors.get('button_primary', self.colors['primary']),
-            text_color=self.colors.get('button_text', 'white'),
-            height=30, font=self.app.get_font(-1)).pack(fill="x", padx=10, pady=(0, 8))
-        
+        entry['lbl_title'].configure(text=title)
+        entry['lbl_meta'].configure(text=meta_text)
+        tags_text = note_tags_text(note)
+        tag_lbl = entry['tag_lbl']
+        if tags_text:
+            tag_lbl.configure(text=tags_text)
+            if not tag_lbl.winfo_manager():
+                tag_lbl.pack(fill="x", padx=10, pady=(0, 5), before=entry['btn_open'])
+        elif tag_lbl.winfo_manager():
+            tag_lbl.pack_forget()
+
     def filter_notes(self, event=None):
-        self.refresh_notes_list()
+        # Debounced: rebuild the list once typing pauses, not on every key
+        if self._filter_after_id is not None:
+            self.app.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.app.after(SEARCH_DEBOUNCE_MS, self._run_filter)
+
+    def _run_filter(self):
+        self._filter_after_id = None
+        if self.search_entry.winfo_exists():  # view may have been closed meanwhile
+            self.refresh_notes_list()
 
     def _insert_template_from(self, templates_dict, selected_name, var_to_reset):
-        if selected_name in templates_dict:
+        # Picking the same template again with no edits since would only
+        # duplicate it, so that insert (and its Text reflow) is skipped
+        if selected_name in templates_dict and not self._is_repeat_template_insert(selected_name):
             content = templates_dict[selected_name]
             current_text = self.text_area.get("1.0", "end-1c")
             if len(current_text.strip()) > 0:
+                current_text += "\n\n" + content
                 self.text_area.insert("end", "\n\n" + content)
             else:
+                current_text = content
                 self.text_area.insert("1.0", content)
             # Add a tag corresponding to the template so users can see which template was used
             try:
@@ -1888,7 +2744,6 @@ class HomeView:
                 if token:
                     new_tag = f"#{token}"
                     # Ensure we don't duplicate tags already in content — check existing content hashtags
-                    current_text = self.text_area.get("1.0", "end-1c")
                     existing = extract_hashtags_from_text(current_text)
                     seen = {t.lstrip('#') for t in existing}
                     if token not in seen:
@@ -1899,12 +2754,26 @@ class HomeView:
                             self.text_area.insert("1.0", new_tag)
             except Exception:
                 pass
+            # Tk sets the modified flag on any later edit, including typing
+            self._last_template_name = selected_name
+            try:
+                self.text_area.edit_modified(False)
+            except Exception:
+                pass
         # Reset the invoking dropdown regardless
         try:
             var_to_reset.set("Select...")
         except Exception:
             pass
 
+    def _is_repeat_template_insert(self, selected_name):
+        if selected_name != self._last_template_name:
+            return False
+        try:
+            return not self.text_area.edit_modified()
+        except Exception:
+            return False
+
     def insert_study_template(self, template_name):
         self._insert_template_from(self.study_templates, template_name, self.study_template_var)
 
@@ -1921,12 +2790,10 @@ class HomeView:
     def on_notebook_created(self, new_notebook_name):
         self.update_notebook_dropdown()
         # Find the display name for this new notebook
-        display_name = f"• {self.master.master.truncate_text(new_notebook_name)}"
+        display_name = f"• {self.app.truncate_text(new_notebook_name)}"
         self.notebook_var.set(display_name)
         # Also refresh sidebar
-        if isinstance(self.master.master, CourseMate):
-             self.master.master.sidebar.refresh_notebooks_list()
-             self.master.master.sidebar.refresh_stats()
+        self.app.schedule_refresh('stats')
 
     def clear_content_area(self):
         """Clear only the content textbox and restore placeholder (title remains)."""
@@ -2120,7 +2987,8 @@ class HomeView:
             messagebox.showinfo("Saved", f"Note saved to '{clean_notebook_name}'")
         else:
             self.data_manager.add_unassigned_note(note)
-            self.refresh_notes_list()
+        # One idle pass redraws the notes list and the header totals
+        self.app.schedule_refresh('notes', 'stats')
 
         # Clear inputs
         self.title_entry.delete(0, "end")
@@ -2145,78 +3013,133 @@ class HomeView:
                 w.destroy()
             self.notes_list = ctk.CTkScrollableFrame(self.notes_list_container, fg_color="transparent")
             self.notes_list.pack(fill="both", expand=True)
+        # Cards are pooled per notes_list; a new list starts a new pool
+        if self._card_pool_owner is not self.notes_list:
+            self._card_pool = []
+            self._card_pool_owner = self.notes_list
+
+        # Gather notes for the active tab; the sorted list is reused while
+        # the data is unchanged (e.g. across search keystrokes)
+        cache_key = (tab, self.data_manager.version)
+        if self._tab_notes_cache is not None and self._tab_notes_cache[0] == cache_key:
+            notes = self._tab_notes_cache[1]
         else:
-            # Clear current view to avoid duplicates before repopulating
-            for w in self.notes_list.winfo_children():
-                w.destroy()
-
-        # Gather notes for the active tab
-        notes = []
-        if tab == "Unassigned":
-            notes = list(self.data_manager.get_unassigned_notes())
-            # Sort by created date (newest first)
-            def get_dt(note):
-                try:
-                    return datetime.fromisoformat(note.get('created', ''))
-                except Exception:
-                    try:
-                        return datetime.strptime(note.get('created', ''), "%B %d, %Y | %I:%M%p")
-                    except Exception:
-                        return datetime.min
-            notes.sort(key=get_dt, reverse=True)
-        elif tab == "Recent":
-            notes = self._get_recent_notes(15)
-        elif tab == "Assigned":
-            notes = self._get_assigned_notes()
+            notes = []
+            if tab == "Unassigned":
+                notes = list(self.data_manager.get_unassigned_notes())
+                # Sort by created date (newest first)
+                notes.sort(key=lambda n: parse_note_datetime(n.get('created', '')), reverse=True)
+            elif tab == "Recent":
+                notes = self._get_recent_notes(15)
+            elif tab == "Assigned":
+                notes = self._get_assigned_notes()
+            self._tab_notes_cache = (cache_key, notes)
 
         # Filter notes according to search term
-        filtered_notes = []
-        for note in notes:
-            tags_str = " ".join(note.get('tags', [])).lower()
-            if search_term:
-                if search_term in note.get('title', '').lower() or \
-                   search_term in note.get('content', '').lower() or \
-                   search_term in tags_str:
-                    filtered_notes.append(note)
-            else:
-                filtered_notes.append(note)
+        if search_term:
+            filtered_notes = [note for note in notes if search_term in note_search_text(note)]
+        else:
+            filtered_notes = notes
+
+        # A new tab or search starts from the first page again; plain
+        # refreshes (e.g. after saving a note) keep what was expanded
+        if self._card_limit_key != (tab, search_term):
+            self._card_limit_key = (tab, search_term)
+            self._card_limit = NOTE_CARD_PAGE_SIZE
+        self._filtered_notes = filtered_notes
+        self._render_note_cards()
+
+    def _render_note_cards(self):
+        """Show the first _card_limit filtered notes using pooled cards."""
+        filtered_notes = self._filtered_notes
+        tab = self._card_limit_key[0]
+        show_more = self._get_show_more_button()
+        show_more.pack_forget()
 
         # If no matches, show placeholder
+        empty_lbl = self._get_empty_notes_label()
+        pool = self._card_pool
         if not filtered_notes:
-            ctk.CTkLabel(self.notes_list, text="No notes found.", font=self.app.get_font(0, "italic"), text_color=self.colors['secondary_text']).pack(pady=20)
+            for entry in pool:
+                entry['frame'].pack_forget()
+            empty_lbl.pack(pady=20)
             return
-
-        # Create cards for filtered results
-        for note in filtered_notes:
-            self._create_note_card(note, tab)
+        empty_lbl.pack_forget()
+
+        # Refill pooled cards in order, growing the pool only when needed.
+        # Visible cards are always a prefix of the pool, so re-packing a
+        # hidden one appends it in the right position.
+        visible = filtered_notes[:self._card_limit]
+        for i, note in enumerate(visible):
+            if i == len(pool):
+                pool.append(self._create_note_card())
+            entry = pool[i]
+            self._fill_note_card(entry, note, tab)
+            if not entry['frame'].winfo_manager():
+                entry['frame'].pack(fill="x", pady=5)
+        # Hide (don't destroy) surplus cards for the next refresh
+        for entry in pool[len(visible):]:
+            if entry['frame'].winfo_manager():
+                entry['frame'].pack_forget()
+
+        remaining = len(filtered_notes) - len(visible)
+        if remaining > 0:
+            show_more.configure(text=f"Show more ({remaining} left)")
+            show_more.pack(pady=(5, 10))
+
+    def _show_more_notes(self):
+        self._card_limit += NOTE_CARD_PAGE_SIZE
+        self._render_note_cards()
+
+    def _get_show_more_button(self):
+        """Return the "Show more" button, creating it once per notes list."""
+        btn = self._show_more_btn
+        if btn is None or not btn.winfo_exists():
+            btn = ctk.CTkButton(self.notes_list, text="Show more", command=self._show_more_notes, fg_color=self.colors['button_primary'], text_color=self.colors['button_text'], font=self.app.get_font(0))
+            self._show_more_btn = btn
+        return btn
+
+    def _get_empty_notes_label(self):
+        """Return the "No notes found." label, creating it once per notes list."""
+        lbl = getattr(self, '_empty_notes_label', None)
+        if lbl is None or not lbl.winfo_exists():
+            lbl = ctk.CTkLabel(self.notes_list, text="No notes found.", font=self.app.get_font(0, "italic"), text_color=self.colors['secondary_text'])
+            self._empty_notes_label = lbl
+        return lbl
 
     def open_note_window(self, note):
         """Open a dedicated window for viewing / editing a single note."""
-        NoteWindow(self.master, note, self.colors, self.data_manager, self.refresh_notes_list)
+        NoteWindow.open(self.master, note, self.colors, self.data_manager, lambda: self.app.schedule_refresh('notes'))
 
 class NoteWindow(ctk.CTkToplevel):
-    """Modal editor for an individual note with word count, move/export features."""
-    def __init__(self, master, note, colors, data_manager, callback):
+    """Modal editor for an individual note with word count, move/export features.
+
+    NoteWindow.open(...) reuses one hidden window per app: later opens only
+    refill the fields instead of building the whole Toplevel again.
+    """
+    def __init__(self, master, note, colors, data_manager, callback, pooled=False):
         super().__init__(master)
-        self.title(note.get('title', 'Note'))
         self.geometry("600x600")
+        self._pooled = pooled
         
         self.colors = colors
         self.note = note
         self.data_manager = data_manager
         self.callback = callback
+        self.app = TemplateDialog._get_app_instance(master)  # None outside the main app
         
         # Make modal and stay on top
         self.transient(master)
         self.grab_set()
         self.focus_force()
+        self.protocol("WM_DELETE_WINDOW", self._close)
         
-        # Use master's font helper if available
-        get_font = master.master.get_font if hasattr(master.master, 'get_font') else lambda s=0, w="normal": ("Open Sans", 14+s, w)
+        # Use the app's font helper if available
+        get_font = self.app.get_font if self.app is not None else lambda s=0, w="normal": ("Open Sans", 14+s, w)
+        self._font_key = get_font(0)
         
         # Editable title
-        initial_title = note.get('title', '').strip() or 'Untitled'
-        self.title_var = tk.StringVar(value=initial_title)
+        self.title_var = tk.StringVar()
         
         # Title Label
         ctk.CTkLabel(self, text="Title", font=get_font(0, "bold"), text_color=colors['main_text']).pack(anchor="w", padx=20, pady=(10, 0))
@@ -2242,15 +3165,11 @@ class NoteWindow(ctk.CTkToplevel):
         self.text_area = ctk.CTkTextbox(self, font=get_font(0), fg_color=colors['background'], text_color=colors['main_text'], wrap="word")
         self.text_area.pack(fill="both", expand=True, padx=20, pady=(5, 0))
         
-        # Insert raw content directly (no formatting model)
-        initial_content = note.get('content', '')
-        self.text_area.insert("1.0", initial_content)
         try:
             def on_key_release(e):
                 self.update_word_count()
                 highlight_hashtags_in_textbox(self.text_area, self.colors.get('accent', '#4a90e2'))
             self.text_area.bind("<KeyRelease>", on_key_release)
-            highlight_hashtags_in_textbox(self.text_area, self.colors.get('accent', '#4a90e2'))
         except Exception:
             try:
                 self.text_area.bind("<KeyRelease>", self.update_word_count)
@@ -2258,22 +3177,21 @@ class NoteWindow(ctk.CTkToplevel):
                 pass
 
         # Word Count Label
-        self.word_count_label = ctk.CTkLabel(self, text="Word Count: 0", font=get_font(-2), text_color=colors['secondary_text'])
-        self.word_count_label.pack(anchor="e", padx=20, pady=(0, 10))
-        self.after(100, self.update_word_count) # Initial count
-        
-        # Date Info Frame
+        # Word count on the right; short-lived save status on the left
+        status_row = ctk.CTkFrame(self, fg_color="transparent")
+        status_row.pack(fill="x", padx=20, pady=(0, 10))
+        self.word_count_label = ctk.CTkLabel(status_row, text="Word Count: 0", font=get_font(-2), text_color=colors['secondary_text'])
+        self.word_count_label.pack(side="right")
+        self.status_label = ctk.CTkLabel(status_row, text="", font=get_font(-2), text_color=colors.get('success', '#27ae60'))
+        self.status_label.pack(side="left")
+        self._status_after_id = None
+        
+        # Date Info Frame (filled in by _load)
         date_frame = ctk.CTkFrame(self, fg_color="transparent")
         date_frame.pack(fill="x", padx=20, pady=(0, 10))
-        # Created On
-        created_text = self.note.get('created', '')
-        human_created = format_human_date(created_text)
-        ctk.CTkLabel(date_frame, text=f"Created on: {human_created}", font=get_font(-3), text_color=self.colors['secondary_text']).pack(anchor="w")
-        # Modified On
-        modified_text = self.note.get('modified', '')
-        if modified_text:
-            human_modified = format_human_date(modified_text)
-            ctk.CTkLabel(date_frame, text=f"Last edited on: {human_modified}", font=get_font(-3), text_color=self.colors['secondary_text']).pack(anchor="w")
+        self.created_label = ctk.CTkLabel(date_frame, text="", font=get_font(-3), text_color=self.colors['secondary_text'])
+        self.created_label.pack(anchor="w")
+        self.modified_label = ctk.CTkLabel(date_frame, text="", font=get_font(-3), text_color=self.colors['secondary_text'])
         
         # Actions Frame
         actions_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -2374,24 +3292,10 @@ class NoteWindow(ctk.CTkToplevel):
         ctk.CTkLabel(move_frame, text="Move to:", font=get_font(0), text_color=colors['accent']).pack(side="left", padx=(0, 5))
         
         self.notebook_var = ctk.StringVar(value="Select Notebook...")
-        
         self.notebook_map = {}
-        notebook_list = []
-        for code, nb_data in self.data_manager.get_notebooks().items():
-            name = nb_data.get("name", code)
-            display_name = master.master.truncate_text(name)
-            notebook_list.append(display_name)
-            self.notebook_map[display_name] = name
+        self._notebook_map_version = None  # data version notebook_map was built from
             
-        # Include an option to move the note to Unassigned Notes
-        notebooks = ["• Unassigned Notes"] + notebook_list
-        if not notebook_list:
-            # If there are no notebooks, allow the user to select 'No Notebooks'
-            notebooks = ["• Unassigned Notes", "No Notebooks"]
-        # Map the unassigned display to a sentinel value (None)
-        self.notebook_map["• Unassigned Notes"] = None
-            
-        self.notebook_dropdown = ctk.CTkOptionMenu(move_frame, variable=self.notebook_var, values=notebooks,
+        self.notebook_dropdown = ctk.CTkOptionMenu(move_frame, variable=self.notebook_var, values=["• Unassigned Notes"],
                        fg_color=colors.get('dropdown_bg', colors['main_text']), button_color=colors.get('accent'),
                        text_color=colors.get('dropdown_text', 'white'), font=get_font(0))
         self.notebook_dropdown.pack(side="left", padx=(0, 10))
@@ -2419,6 +3323,114 @@ class NoteWindow(ctk.CTkToplevel):
                           fg_color=colors['info'], text_color="white", font=get_font(0))
             self.move_btn.pack(side="left")
 
+        self._load(note, callback)
+
+    @classmethod
+    def open(cls, master, note, colors, data_manager, callback):
+        """Show note in the app's shared note window, creating it on first use."""
+        app = TemplateDialog._get_app_instance(master)
+        owner = app or master
+        win = getattr(owner, '_note_window', None)
+        # Widgets carry the theme and font they were built with, so a
+        # theme/font change means building a fresh window once
+        if (win is not None and win.winfo_exists()
+                and win.colors is colors and win.data_manager is data_manager
+                and (app is None or win._font_key == app.get_font(0))):
+            win._load(note, callback)
+            win.deiconify()
+            win.lift()
+            try:
+                win.grab_set()
+                win.focus_force()
+            except Exception:
+                pass
+            return win
+        if win is not None and win.winfo_exists():
+            win.destroy()
+        win = cls(owner, note, colors, data_manager, callback, pooled=True)
+        owner._note_window = win
+        return win
+
+    def _load(self, note, callback):
+        """Point the window at note and refill every note-specific field."""
+        self.note = note
+        self.callback = callback
+        if self._status_after_id is not None:
+            self.after_cancel(self._status_after_id)
+            self._clear_status()
+        title = note.get('title', '').strip() or 'Untitled'
+        self.title(note.get('title', 'Note'))
+        self.title_var.set(title)
+
+        # Insert raw content directly (no formatting model)
+        self.text_area.delete("1.0", "end")
+        self.text_area.insert("1.0", note.get('content', ''))
+        try:
+            highlight_hashtags_in_textbox(self.text_area, self.colors.get('accent', '#4a90e2'))
+        except Exception:
+            pass
+        self.update_word_count()
+
+        self.created_label.configure(text=f"Created on: {format_human_date(note.get('created', ''))}")
+        modified_text = note.get('modified', '')
+        if modified_text:
+            self.modified_label.configure(text=f"Last edited on: {format_human_date(modified_text)}")
+            if not self.modified_label.winfo_manager():
+                self.modified_label.pack(anchor="w")
+        elif self.modified_label.winfo_manager():
+            self.modified_label.pack_forget()
+
+        # The pooled window keeps its dropdown while the data is unchanged
+        if self._notebook_map_version != self.data_manager.version:
+            self._notebook_map_version = self.data_manager.version
+            # One pass: display label -> notebook name. The Unassigned
+            # option maps to the None sentinel and always comes first.
+            self.notebook_map = {"• Unassigned Notes": None}
+            for code, nb_data in self.data_manager.get_notebooks().items():
+                name = nb_data.get("name", code)
+                self.notebook_map[truncate_label(name)] = name
+            notebooks = list(self.notebook_map)
+            if len(notebooks) == 1:
+                # If there are no notebooks, allow the user to select 'No Notebooks'
+                notebooks.append("No Notebooks")
+            self.notebook_dropdown.configure(values=notebooks)
+        self.notebook_var.set("Select Notebook...")
+
+    def _close_after_change(self):
+        """Close after a delete/move, refresh the caller and queue the header counts.
+
+        The counts go through app.schedule_refresh, so they merge with any
+        refresh the callback queues into a single idle-time pass.
+        """
+        callback = self.callback
+        self._close()
+        if callback:
+            callback()
+        if self.app is not None:
+            self.app.schedule_refresh('stats')
+
+    def _close(self):
+        try:
+            self.grab_release()
+        except Exception:
+            pass
+        if self._pooled:
+            self.callback = None  # don't keep the caller's view alive
+            self.withdraw()
+        else:
+            self.destroy()
+
+    def _show_status(self, text, ms=2500):
+        """Show text under the editor for a moment (replaces a modal info box)."""
+        if self._status_after_id is not None:
+            self.after_cancel(self._status_after_id)
+        self.status_label.configure(text=text)
+        self._status_after_id = self.after(ms, self._clear_status)
+
+    def _clear_status(self):
+        self._status_after_id = None
+        self.status_label.configure(text="")
+
     def update_word_count(self, event=None):
         text = self.text_area.get("1.0", "end-1c")
         words = text.split()
@@ -2497,10 +3509,14 @@ class NoteWindow(ctk.CTkToplevel):
         self.note['content'] = new_content
         
         # Update modified timestamp
-        self.note['modified'] = datetime.now().strftime("%B %d, %Y | %I:%M%p")
-        
-        self.data_manager.save_data()
-        messagebox.showinfo("Saved", "Title and content saved.", parent=self)
+        # (ISO 8601, same as 'created', so it sorts and displays without a
+        # legacy-format re-parse)
+        self.note['modified'] = datetime.now().isoformat(timespec='seconds')
+        
+        # An edit in place: the note and notebook totals stay the same
+        self.data_manager.mark_dirty(counts_changed=False)
+        # Non-modal confirmation: the write itself happens in the background
+        self._show_status("Title and content saved.")
         if self.callback:
             self.callback()
 
@@ -2508,11 +3524,15 @@ class NoteWindow(ctk.CTkToplevel):
 
     def delete_note(self):
         if messagebox.askyesno("Delete Note", "Are you sure you want to delete this note? This cannot be undone."):
+            # Notes with an id (all of them since load-time migration) are
+            # found through DataManager's id index, wherever they live
+            note_id = self.note.get("id")
+            if note_id and self.data_manager.delete_note_by_id(note_id):
+                self._close_after_change()
+                return
             # Prefer course code for notebook lookup
             notebook_code = self.note.get("notebook") or self.note.get("_notebook")
             deleted = False
-            # Prefer unique id for note matching
-            note_id = self.note.get("id")
             def note_match(a, b):
                 if a.get("id") and b.get("id"):
                     return a["id"] == b["id"]
@@ -2533,12 +3553,8 @@ class NoteWindow(ctk.CTkToplevel):
                         deleted = True
                         break
                 if deleted:
-                    self.data_manager.save_data()
-                    self.destroy()
-                    if self.callback:
-                        self.callback()
-                    if isinstance(self.master.master, CourseMate):
-                        self.master.master.sidebar.refresh_stats()
+                    self.data_manager.mark_dirty()
+                    self._close_after_change()
                     return
             else:
                 # Use course code for notebook lookup
@@ -2552,12 +3568,8 @@ class NoteWindow(ctk.CTkToplevel):
                             deleted = True
                             break
                     if deleted:
-                        self.data_manager.save_data()
-                        self.destroy()
-                        if self.callback:
-                            self.callback()
-                        if isinstance(self.master.master, CourseMate):
-                            self.master.master.sidebar.refresh_stats()
+                        self.data_manager.mark_dirty()
+                        self._close_after_change()
                         return
             messagebox.showerror("Error", "Could not find note to delete.")
 
@@ -2578,15 +3590,7 @@ class NoteWindow(ctk.CTkToplevel):
         success, msg = self.data_manager.move_note_by_id(note_id, current_notebook, target_notebook)
         if success:
             messagebox.showinfo("Move Note", msg)
-            self.destroy()
-            if self.callback:
-                self.callback()
-            if isinstance(self.master.master, CourseMate):
-                try:
-                    self.master.master.sidebar.refresh_stats()
-                    self.master.master.sidebar.refresh_notebooks_list()
-                except Exception:
-                    pass
+            self._close_after_change()
         else:
             messagebox.showerror("Move Note", msg)
 
@@ -2608,8 +3612,9 @@ class EditNotebookDialog(ctk.CTkToplevel):
         self.grab_set()
         self.focus_force()
         
-        # Use master's font helper
-        get_font = master.master.get_font if hasattr(master.master, 'get_font') else lambda s=0, w="normal": ("Open Sans", 14+s, w)
+        # Use the app's font helper
+        self.app = TemplateDialog._get_app_instance(master)
+        get_font = self.app.get_font if self.app is not None else lambda s=0, w="normal": ("Open Sans", 14+s, w)
         
         title_text = "Edit Notebook" if self.is_edit_mode else "New Notebook"
         ctk.CTkLabel(self, text=title_text, font=get_font(4, "bold"), text_color=colors['main_text']).pack(pady=20)
@@ -2669,29 +3674,15 @@ class EditNotebookDialog(ctk.CTkToplevel):
             messagebox.showwarning("Code Too Long", "Course code must be 15 characters or less.")
             return
         if self.is_edit_mode:
-            notebooks = self.data_manager.get_notebooks()
-            # Check if code changed and if new code already exists
-            if code != self.original_code and code in notebooks:
-                messagebox.showerror("Error", "A notebook with this course code already exists.")
-                return
-            # Get the notebook data
-            nb_data = notebooks.get(self.original_code)
-            if nb_data:
-                nb_data["name"] = name
-                nb_data["code"] = code
-                nb_data["instructor"] = instructor
-                # If code changed, move to new key
-                if code != self.original_code:
-                    notebooks[code] = nb_data
-                    del notebooks[self.original_code]
-                    self.original_code = code
-                self.data_manager.save_data()
-                messagebox.showinfo("Saved", "Notebook changes saved.", parent=self)
+            success, message = self.data_manager.update_notebook(self.original_code, name, code, instructor)
+            if success:
+                self.original_code = code
+                messagebox.showinfo("Saved", message, parent=self)
                 if self.callback:
                     self.callback(name)
                 self.destroy()
             else:
-                messagebox.showerror("Error", "Notebook not found!")
+                messagebox.showerror("Error", message)
         else:
             result = self.data_manager.add_notebook(name, code, instructor)
             if isinstance(result, tuple):
@@ -2717,8 +3708,26 @@ class NotebooksView:
         self.master = master
         self.data_manager = data_manager
         self.colors = colors
-        self.app = app or getattr(master, "master", None)
+        # Resolved once; None only when used outside the main window
+        self.app = app or TemplateDialog._get_app_instance(master)
+        # get_font runs for every label of every card; resolve its source once
+        self._app_get_font = getattr(self.app, "get_font", None)
+        self._font_family = getattr(self.app, "font_family", "Open Sans")
+        self._font_base = getattr(self.app, "base_font_size", 14)
         self.selected_notebook = None  # Initialize selected_notebook attribute
+        self._empty_labels = {}  # parent widget -> reusable empty-state label
+        self._filter_after_id = None  # pending debounced search refresh
+        self._notes_limit = NOTE_CARD_PAGE_SIZE  # note items shown before "Show more"
+        self._notes_limit_key = None  # (notebook, search) the limit applies to
+        self._note_matches = []
+        self._notes_shown = 0
+        self._more_notes_btn = None
+        self._note_del_icon = None
+        self._note_item_pool = []  # reusable note items in notes_area
+        self._list_screen = None      # notebook grid screen, see show_all_notebooks
+        self._notebook_screen = None  # single notebook screen, see show_notebook
+        self._nb_card_pool = []       # reusable notebook cards in grid_frame
+        self._nb_card_style = None
         
         self.container = ctk.CTkFrame(master, fg_color="transparent")
         self.container.pack(fill="both", expand=True, padx=20, pady=20)
@@ -2737,32 +3746,36 @@ class NotebooksView:
             self.show_all_notebooks()
 
     def get_font(self, size_offset=0, weight="normal", slant="roman"):
-        if self.app and hasattr(self.app, "get_font"):
-            return self.app.get_font(size_offset, weight, slant)
-        base_size = getattr(self.app, "base_font_size", 14) if self.app else 14
-        family = getattr(self.app, "font_family", "Open Sans") if self.app else "Open Sans"
-        return (family, base_size + size_offset, weight, slant)
+        if self._app_get_font is not None:
+            return self._app_get_font(size_offset, weight, slant)
+        return fallback_font(self._font_family, self._font_base, size_offset, weight, slant)
 
     def truncate_text(self, text, limit=25):
-        if self.app and hasattr(self.app, "truncate_text"):
-            return self.app.truncate_text(text, limit)
-        if len(text) <= limit:
-            return text
-        return text[:max(limit - 3, 0)] + "..."
+        return truncate_label(text, limit)
 
     def show_all_notebooks(self):
-        # Clear container
-        for widget in self.container.winfo_children():
-            widget.destroy()
-            
+        # The two screens (notebook grid / single notebook) are built once
+        # and swapped with pack_forget instead of being destroyed and rebuilt
+        if self._notebook_screen is not None:
+            self._notebook_screen.pack_forget()
+        if self._list_screen is None:
+            self._build_list_screen()
+        else:
+            self.notebook_search_entry.delete(0, "end")
+        self._list_screen.pack(fill="both", expand=True)
+        self.refresh_notebooks_grid()
+
+    def _build_list_screen(self):
+        self._list_screen = screen = ctk.CTkFrame(self.container, fg_color="transparent")
+
         # Header
-        header = ctk.CTkFrame(self.container, fg_color="transparent")
+        header = ctk.CTkFrame(screen, fg_color="transparent")
         header.pack(fill="x", pady=(0, 20))
         ctk.CTkLabel(header, text="YOUR NOTEBOOKS", font=self.get_font(6, "bold"), text_color=self.colors['main_text']).pack(side="left")
         ctk.CTkButton(header, text="+ Create Notebook", command=self.add_notebook, fg_color=self.colors['success'], text_color="white").pack(side="right")
         
         # Search Bar for Notebooks
-        search_frame = ctk.CTkFrame(self.container, fg_color="transparent")
+        search_frame = ctk.CTkFrame(screen, fg_color="transparent")
         search_frame.pack(fill="x", padx=0, pady=(0, 10))
         
         self.notebook_search_entry = ctk.CTkEntry(
@@ -2774,29 +3787,55 @@ class NotebooksView:
             border_width=2,
             height=40,
             width=250,
-            font=self.master.master.get_font(0)
+            font=self.app.get_font(0)
         )
         self.notebook_search_entry.pack(side="left", expand=True)
         self.notebook_search_entry.bind("<KeyRelease>", self.filter_notebooks)
         
         # Grid Container
-        self.grid_frame = ctk.CTkScrollableFrame(self.container, fg_color="transparent")
+        self.grid_frame = ctk.CTkScrollableFrame(screen, fg_color="transparent")
         self.grid_frame.pack(fill="both", expand=True)
         
-        self.refresh_notebooks_grid()
-
     def filter_notebooks(self, event=None):
-        self.refresh_notebooks_grid()
+        self._debounce_filter(self.notebook_search_entry, self.refresh_notebooks_grid)
+
+    def _debounce_filter(self, entry, refresh):
+        """Run refresh once typing in entry pauses (restarts on each key)."""
+        if self._filter_after_id is not None:
+            self.app.after_cancel(self._filter_after_id)
+
+        def run():
+            self._filter_after_id = None
+            if entry.winfo_exists():  # the screen may have changed meanwhile
+                refresh()
+        self._filter_after_id = self.app.after(SEARCH_DEBOUNCE_MS, run)
+
+    def _show_empty_state(self, parent, text, pady, size_offset=0):
+        """Show a reusable placeholder label in parent (one label per parent)."""
+        font = self.get_font(size_offset, "italic")
+        lbl = self._empty_labels.get(parent)
+        if lbl is None or not lbl.winfo_exists():
+            lbl = ctk.CTkLabel(parent, text=text, font=font, text_color=self.colors['secondary_text'])
+            self._empty_labels[parent] = lbl
+        else:
+            lbl.configure(text=text, font=font)
+        lbl.pack(pady=pady)
 
     def refresh_notebooks_grid(self):
-        # Clear grid frame
-        for widget in self.grid_frame.winfo_children():
-            widget.destroy()
+        # Hide pooled cards (grid) before the empty-state label (pack) can
+        # be shown: Tk refuses mixing both managers in one parent
+        pool = self._nb_card_pool
+        for entry in pool:
+            if entry['frame'].winfo_manager():
+                entry['frame'].grid_forget()
+        empty_lbl = self._empty_labels.get(self.grid_frame)
+        if empty_lbl is not None and empty_lbl.winfo_exists():
+            empty_lbl.pack_forget()
 
         # Grid Layout Logic
         notebooks = self.data_manager.get_notebooks()
         if not notebooks:
-            ctk.CTkLabel(self.grid_frame, text="No notebooks yet. Create one to get started!", font=self.get_font(0, "italic"), text_color=self.colors['secondary_text']).pack(pady=50)
+            self._show_empty_state(self.grid_frame, "No notebooks yet. Create one to get started!", 50)
             return
 
         search_term = self.notebook_search_entry.get().lower().strip() if hasattr(self, 'notebook_search_entry') else ""
@@ -2812,8 +3851,7 @@ class NotebooksView:
                 filtered_notebooks[code] = data
 
         if not filtered_notebooks and search_term:
-             ctk.CTkLabel(self.grid_frame, text="No matching notebooks found", font=self.get_font(0, "italic"), 
-                         text_color=self.colors['secondary_text']).pack(pady=50)
+             self._show_empty_state(self.grid_frame, "No matching notebooks found", 50)
              return
 
         # Configure grid columns
@@ -2821,19 +3859,46 @@ class NotebooksView:
         for i in range(columns):
             self.grid_frame.grid_columnconfigure(i, weight=1)
 
+        # Reuse pooled cards, creating only as many as were never needed before
+        if self._nb_card_style is None:
+            self._nb_card_style = self._notebook_card_style()
+        style = self._nb_card_style
+        fill_card = self._fill_notebook_card
         for i, (code, data) in enumerate(filtered_notebooks.items()):
-            name = data.get("name", code)
-            row = i // columns
-            col = i % columns
-            self._create_notebook_card(name, data, row, col)
+            if i == len(pool):
+                pool.append(self._create_notebook_card(style))
+            entry = pool[i]
+            fill_card(entry, data.get("name", code), data)
+            row, col = divmod(i, columns)
+            entry['frame'].grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
+
+    def _notebook_card_style(self):
+        """Icons, fonts and colours shared by every notebook card.
+
+        load_icon reads and resizes the PNG from disk on each call, so the
+        icons in particular are loaded once instead of per card.
+        """
+        colors = self.colors
+        style = {
+            'border': colors.get('card_border', colors.get('muted', '#68707a')),
+            'font_title': self.get_font(2, "bold"),
+            'font_meta': self.get_font(-2),
+            'font_count': self.get_font(-2, "bold"),
+            'font_open': self.get_font(-1),
+        }
+        for key, filename in (('img_edit', 'icon_edit_32_white.png'), ('img_del', 'icon_delete_32_white.png')):
+            try:
+                style[key] = load_icon(filename, size=(24,24))
+            except Exception:
+                style[key] = None
+        return style
 
-    def _create_notebook_card(self, name, data, row, col):
+    def _create_notebook_card(self, style):
+        """Build an empty notebook card; _fill_notebook_card points it at a notebook."""
         # Card Frame with border
-        border_color = self.colors.get('card_border', self.colors.get('muted', '#68707a'))
         corner = 12
         card = ctk.CTkFrame(self.grid_frame, fg_color=self.colors['card_bg'], corner_radius=corner,
-                           border_width=2, border_color=border_color)
-        card.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
+                           border_width=2, border_color=style['border'])
         # Remove hover effect from card
         
         # Header with icon buttons
@@ -2841,86 +3906,115 @@ class NotebooksView:
         header.pack(fill="x", padx=15, pady=(15, 10))
         
         # Title on the left - always show notebook name
-        display_name = data.get("name", name).strip() if data.get("name", name) else "(Unnamed)"
-        display_name = self.truncate_text(display_name, 40)
-        lbl_title = ctk.CTkLabel(header, text=display_name, font=self.get_font(2, "bold"), 
+        lbl_title = ctk.CTkLabel(header, text="", font=style['font_title'], 
                                  text_color=self.colors['main_text'])
         lbl_title.pack(side="left")
         
         # Icon buttons on the right
         # Edit and Delete buttons with white icons and correct bg colors
-        try:
-            img_edit = load_icon('icon_edit_32_white.png', size=(24,24))
-        except Exception:
-            img_edit = None
-        try:
-            img_del = load_icon('icon_delete_32_white.png', size=(24,24))
-        except Exception:
-            img_del = None
+        img_edit = style['img_edit']
+        img_del = style['img_del']
 
         # Delete button with tooltip
         btn_del = ctk.CTkButton(header, image=img_del, text="", width=36, height=32,
-            command=lambda n=name: self.delete_notebook(n),
             fg_color=self.colors.get('danger', '#e74c3c'), hover_color="#c0392b",
             border_width=0)
         btn_del.pack(side="right", padx=(5, 0))
         ToolTip(btn_del, "Delete this notebook")
-        # Edit button with hover and tooltip
+        # Edit button with hover and tooltip (the button's own hover_color
+        # replaces per-card <Enter>/<Leave> closures)
         btn_edit = ctk.CTkButton(header, image=img_edit, text="", width=36, height=32,
-            command=lambda n=name: self.rename_notebook(n),
-            fg_color=self.colors.get('info', '#3498db'), border_width=0)
+            fg_color=self.colors.get('info', '#3498db'), hover_color=self.colors.get('accent', '#4a90e2'),
+            border_width=0)
         btn_edit.pack(side="right", padx=(5, 0))
-        def on_edit_enter(event):
-            btn_edit.configure(fg_color=self.colors.get('accent', '#4a90e2'))
-        def on_edit_leave(event):
-            btn_edit.configure(fg_color=self.colors.get('info', '#3498db'))
-        btn_edit.bind("<Enter>", on_edit_enter)
-        btn_edit.bind("<Leave>", on_edit_leave)
         ToolTip(btn_edit, "Rename this notebook")
         # Hover effect for the card (subtle change using theme hover color)
         # Hover color change removed as requested
         
         # Meta (Code | Instructor)
-        meta = []
-        if data.get("code"):
-            meta.append(data["code"])
-        if data.get("instructor"):
-            meta.append(data["instructor"])
-        meta_text = " • ".join(meta) if meta else "No details"
-        
-        lbl_meta = ctk.CTkLabel(card, text=meta_text, font=self.get_font(-2), 
+        lbl_meta = ctk.CTkLabel(card, text="", font=style['font_meta'], 
                                text_color=self.colors['secondary_text'])
         lbl_meta.pack(padx=15, pady=(0, 8), anchor="w")
         
         # Stats (Note Count)
-        note_count = len(data.get("notes", []))
-        lbl_count = ctk.CTkLabel(card, text=f"{note_count} Notes", font=self.get_font(-2, "bold"), 
+        lbl_count = ctk.CTkLabel(card, text="", font=style['font_count'], 
                                 text_color=self.colors['accent'])
         lbl_count.pack(padx=15, pady=(0, 10), anchor="w")
         
         # Open Notebook Button at bottom
-        btn_open = ctk.CTkButton(card, text="Open Notebook", command=lambda n=display_name: self.show_notebook(n),
+        btn_open = ctk.CTkButton(card, text="Open Notebook",
                  fg_color=self.colors.get('button_primary', self.colors['primary']), 
                  text_color=self.colors.get('button_text', 'white'),
-                 height=30, font=self.get_font(-1))
+                 height=30, font=style['font_open'])
         btn_open.pack(fill="x", padx=15, pady=(0, 15))
+        return {'frame': card, 'lbl_title': lbl_title, 'lbl_meta': lbl_meta, 'lbl_count': lbl_count,
+                'btn_del': btn_del, 'btn_edit': btn_edit, 'btn_open': btn_open}
+
+    def _fill_notebook_card(self, entry, name, data):
+        """Update a pooled card's labels and buttons for notebook `name`.
+
+        A card that already shows the same notebook, details and note count
+        is left untouched (each CTk configure() redraws the widget).
+        """
+        shown = (name, data.get("name"), data.get("code"), data.get("instructor"), len(data.get('notes', [])))
+        if entry.get('shown') == shown:
+            return
+        entry['shown'] = shown
+        display_name = data.get("name", name).strip() if data.get("name", name) else "(Unnamed)"
+        entry['lbl_title'].configure(text=self.truncate_text(display_name, 40))
+        meta = []
+        if data.get("code"):
+            meta.append(data["code"])
+        if data.get("instructor"):
+            meta.append(data["instructor"])
+        entry['lbl_meta'].configure(text=" • ".join(meta) if meta else "No details")
+        entry['lbl_count'].configure(text=f"{len(data.get('notes', []))} Notes")
+        entry['btn_del'].configure(command=partial(self.delete_notebook, name))
+        entry['btn_edit'].configure(command=partial(self.rename_notebook, name))
+        entry['btn_open'].configure(command=partial(self.show_notebook, name))
 
     def show_notebook(self, name):
         self.selected_notebook = name
         
-        # Find notebook data
-        notebook_data = None
-        for code, nb_data in self.data_manager.get_notebooks().items():
+        notebook_data = self._find_notebook(name)
+
+        # Swap screens (see show_all_notebooks); the notebook screen is
+        # built once and only its title, details and search are reset here
+        if self._list_screen is not None:
+            self._list_screen.pack_forget()
+        if self._notebook_screen is None:
+            self._build_notebook_screen()
+        else:
+            self.search_entry.delete(0, "end")
+        self._nb_title_lbl.configure(text=name)
+
+        # Meta Info (Code | Instructor)
+        meta_parts = []
+        if notebook_data:
+            if notebook_data.get("code"): meta_parts.append(notebook_data["code"])
+            if notebook_data.get("instructor"): meta_parts.append(notebook_data["instructor"])
+        if meta_parts:
+            self._nb_meta_lbl.configure(text=" | ".join(meta_parts))
+            if not self._nb_meta_lbl.winfo_manager():
+                self._nb_meta_lbl.pack(side="left", padx=(15, 0), pady=(5, 0), after=self._nb_title_lbl)
+        elif self._nb_meta_lbl.winfo_manager():
+            self._nb_meta_lbl.pack_forget()
+
+        self._notebook_screen.pack(fill="both", expand=True)
+        self.refresh_notebook_notes(notebook_data)
+
+    def _find_notebook(self, name):
+        """Notebook data for a display name, or None if it no longer exists."""
+        for nb_data in self.data_manager.get_notebooks().values():
             if nb_data.get("name") == name:
-                notebook_data = nb_data
-                break
+                return nb_data
+        return None
+
+    def _build_notebook_screen(self):
+        self._notebook_screen = screen = ctk.CTkFrame(self.container, fg_color="transparent")
 
-        # Clear container
-        for widget in self.container.winfo_children():
-            widget.destroy()
-            
         # Header
-        header = ctk.CTkFrame(self.container, fg_color="transparent")
+        header = ctk.CTkFrame(screen, fg_color="transparent")
         header.pack(fill="x", pady=(0, 20))
         
 
@@ -2933,16 +4027,11 @@ class NotebooksView:
             fg_color=self.colors.get('sidebar_bg', 'transparent'), hover_color=self.colors.get('sidebar_hover', '#405977'), border_width=0).pack(side="left", padx=(0, 10))
 
         # Title
-        ctk.CTkLabel(header, text=name, font=self.get_font(6, "bold"), text_color=self.colors['main_text']).pack(side="left")
+        self._nb_title_lbl = ctk.CTkLabel(header, text="", font=self.get_font(6, "bold"), text_color=self.colors['main_text'])
+        self._nb_title_lbl.pack(side="left")
 
-        # Meta Info (Code | Instructor)
-        if notebook_data:
-            meta_parts = []
-            if notebook_data.get("code"): meta_parts.append(notebook_data["code"])
-            if notebook_data.get("instructor"): meta_parts.append(notebook_data["instructor"])
-            if meta_parts:
-                meta_text = " | ".join(meta_parts)
-                ctk.CTkLabel(header, text=meta_text, font=self.get_font(-2), text_color=self.colors['secondary_text']).pack(side="left", padx=(15, 0), pady=(5, 0))
+        # Meta Info (Code | Instructor); packed by show_notebook when there is any
+        self._nb_meta_lbl = ctk.CTkLabel(header, text="", font=self.get_font(-2), text_color=self.colors['secondary_text'])
 
         # Actions: Delete and Rename as icons
         try:
@@ -2963,7 +4052,7 @@ class NotebooksView:
         self.master.after(100, lambda: ToolTip(btn_rename, "Rename this notebook"))
         
         # Search Bar
-        search_frame = ctk.CTkFrame(self.container, fg_color="transparent")
+        search_frame = ctk.CTkFrame(screen, fg_color="transparent")
         search_frame.pack(fill="x", padx=0, pady=(0, 10))
         
         self.search_entry = ctk.CTkEntry(
@@ -2975,56 +4064,104 @@ class NotebooksView:
             border_width=2,
             height=40,
             width=250,
-            font=self.master.master.get_font(0))
+            font=self.app.get_font(0))
         self.search_entry.pack(side="left", expand=True)
         self.search_entry.bind("<KeyRelease>", self.filter_notes)
                
         # Notes List
-        self.notes_area = ctk.CTkScrollableFrame(self.container, fg_color="transparent")
+        self.notes_area = ctk.CTkScrollableFrame(screen, fg_color="transparent")
         self.notes_area.pack(fill="both", expand=True)
-        
-        self.refresh_notebook_notes()
 
     def filter_notes(self, event=None):
-        self.refresh_notebook_notes()
-
-    def refresh_notebook_notes(self):
-        # Clear notes area
-        for widget in self.notes_area.winfo_children():
-            widget.destroy()
+        self._debounce_filter(self.search_entry, self.refresh_notebook_notes)
+
+    def refresh_notebook_notes(self, notebook_data=None):
+        # Hide (don't destroy) the previous items; _render_note_items
+        # refills them in order
+        for entry in self._note_item_pool:
+            if entry['frame'].winfo_manager():
+                entry['frame'].pack_forget()
+        if self._more_notes_btn is not None:
+            self._more_notes_btn.pack_forget()
+        empty_lbl = self._empty_labels.get(self.notes_area)
+        if empty_lbl is not None and empty_lbl.winfo_exists():
+            empty_lbl.pack_forget()
             
         name = self.selected_notebook
-        notebook_data = None
-        for code, nb_data in self.data_manager.get_notebooks().items():
-            if nb_data.get("name") == name:
-                notebook_data = nb_data
-                break
+        # show_notebook passes the notebook it already looked up
+        if notebook_data is None:
+            notebook_data = self._find_notebook(name)
         
         notes = notebook_data.get('notes', []) if notebook_data else []
         
         search_term = self.search_entry.get().lower().strip() if hasattr(self, 'search_entry') else ""
         
         if not notes:
-            ctk.CTkLabel(self.notes_area, text="No notes in this notebook", font=self.get_font(-2, "italic"), text_color=self.colors['secondary_text']).pack(pady=50)
+            self._show_empty_state(self.notes_area, "No notes in this notebook", 50, size_offset=-2)
             return
 
-        match_found = False
-        for i, note in enumerate(notes):
-            if search_term:
-                tags_str = " ".join(note.get('tags', [])).lower()
-                if search_term not in note.get('title', '').lower() and \
-                   search_term not in note.get('content', '').lower() and \
-                   search_term not in tags_str:
-                    continue
-            
-            match_found = True
-            self._create_note_item(note, i)
-            
-        if not match_found and search_term:
-             ctk.CTkLabel(self.notes_area, text="No matches found", font=self.get_font(0, "italic"), 
-                         text_color=self.colors['secondary_text']).pack(pady=20)
+        matches = [(i, note) for i, note in enumerate(notes)
+                   if not search_term or search_term in note_search_text(note)]
+        if not matches and search_term:
+             self._show_empty_state(self.notes_area, "No matches found", 20)
+             return
 
-    def _create_note_item(self, note, index):
+        # Items are built a page at a time. Re-rendering the same notebook
+        # and search (e.g. after a delete) keeps the pages already opened.
+        limit_key = (name, search_term)
+        if self._notes_limit_key != limit_key:
+            self._notes_limit_key = limit_key
+            self._notes_limit = NOTE_CARD_PAGE_SIZE
+        self._note_matches = matches
+        self._notes_shown = 0
+        self._render_note_items(self._notes_limit)
+
+    def _render_note_items(self, upto):
+        """Show note items until `upto` matches are shown, then a "Show more" button.
+
+        Items come from a pool that only grows; the visible ones are always
+        a prefix of it, so re-packing a hidden item appends it in place.
+        """
+        more_btn = self._more_notes_btn
+        if more_btn is not None:
+            more_btn.pack_forget()
+        pool = self._note_item_pool
+        matches = self._note_matches
+        end = min(upto, len(matches))
+        for k in range(self._notes_shown, end):
+            if k == len(pool):
+                pool.append(self._create_note_item())
+            entry = pool[k]
+            index, note = matches[k]
+            self._fill_note_item(entry, note, index)
+            entry['frame'].pack(fill="x", padx=10, pady=6)
+        self._notes_shown = end
+        remaining = len(matches) - end
+        if remaining > 0:
+            if more_btn is None:
+                more_btn = self._more_notes_btn = ctk.CTkButton(self.notes_area, text="",
+                    command=self._show_more_note_items,
+                    fg_color=self.colors.get('button_primary', self.colors['primary']),
+                    text_color=self.colors.get('button_text', 'white'), font=self.get_font(-1))
+            more_btn.configure(text=f"Show more ({remaining} left)")
+            more_btn.pack(pady=(5, 10))
+
+    def _show_more_note_items(self):
+        self._notes_limit = self._notes_shown + NOTE_CARD_PAGE_SIZE
+        self._render_note_items(self._notes_limit)
+
+    def _create_note_item(self):
+        """Build an empty note item for the pool; _fill_note_item sets its content.
+
+        The buttons read the item's current note and index, so a pooled item
+        can be refilled without reconfiguring its commands.
+        """
+        if self._note_del_icon is None:
+            try:
+                self._note_del_icon = load_icon('icon_delete_32_white.png', size=(24,24))
+            except Exception:
+                pass
+        entry = {'note': None, 'index': None}
         border_color = self.colors.get('card_border', self.colors.get('muted', '#68707a'))
         card = ctk.CTkFrame(
             self.notes_area,
@@ -3033,13 +4170,45 @@ class NotebooksView:
             border_width=2,
             border_color=border_color
         )
-        card.pack(fill="x", padx=10, pady=6)
         
         # Header
         header = ctk.CTkFrame(card, fg_color="transparent")
         header.pack(fill="x", padx=15, pady=10)
         
-        ctk.CTkLabel(header, text=note.get('title', 'Untitled'), font=self.get_font(0, "bold"), text_color=self.colors['main_text']).pack(side="left")
+        lbl_title = ctk.CTkLabel(header, text="", font=self.get_font(0, "bold"), text_color=self.colors['main_text'])
+        lbl_title.pack(side="left")
+        
+        lbl_date = ctk.CTkLabel(header, text="", font=self.get_font(-3), text_color=self.colors['secondary_text'])
+        lbl_date.pack(side="left", padx=10)
+        
+        # Delete Note Button (icon loaded once per view)
+        ctk.CTkButton(header, image=self._note_del_icon, text="", width=36, height=32, command=lambda: self.delete_note(entry['index']),
+            fg_color=self.colors.get('danger', '#e74c3c'), hover_color="#c0392b", border_width=0).pack(side="right")
+        
+        # Preview
+        lbl_preview = ctk.CTkLabel(card, text="", font=self.get_font(-1), text_color=self.colors['main_text'], anchor="w")
+        lbl_preview.pack(fill="x", padx=15, pady=(0, 5))
+        
+        # Tags (packed by _fill_note_item when the note has any)
+        lbl_tags = ctk.CTkLabel(card, text="", font=self.get_font(-3, "italic"), text_color=self.colors['accent'], anchor="w")
+        
+        # Open Button
+        btn_open = ctk.CTkButton(card, text="Open Note", command=lambda: self.open_note(entry['note']),
+                    fg_color=self.colors.get('button_primary', 
+                    self.colors['primary']), 
+                    text_color=self.colors.get('button_text', 'white'),
+                    height=30, font=self.get_font(-1))
+        btn_open.pack(fill="x", padx=15, pady=(0, 10))
+        # Hover color change removed as requested
+        entry.update(frame=card, lbl_title=lbl_title, lbl_date=lbl_date, lbl_preview=lbl_preview,
+                     lbl_tags=lbl_tags, btn_open=btn_open)
+        return entry
+
+    def _fill_note_item(self, entry, note, index):
+        """Point a pooled note item at note (position index in its notebook)."""
+        entry['note'] = note
+        entry['index'] = index
+        entry['lbl_title'].configure(text=note.get('title', 'Untitled'))
         
         # Format date for display (use human-readable)
         created_text = note.get('created', '')
@@ -3051,34 +4220,19 @@ class NotebooksView:
         if modified_text:
             human_modified = format_human_date(modified_text)
             date_display += f"  •  Last edited on: {human_modified}"
-             
-        ctk.CTkLabel(header, text=date_display, font=self.get_font(-3), text_color=self.colors['secondary_text']).pack(side="left", padx=10)
-        
-        # Delete Note Button
-        try:
-            img_del = load_icon('icon_delete_32_white.png', size=(24,24))
-        except Exception:
-            img_del = None
-        ctk.CTkButton(header, image=img_del, text="", width=36, height=32, command=lambda: self.delete_note(index),
-            fg_color=self.colors.get('danger', '#e74c3c'), hover_color="#c0392b", border_width=0).pack(side="right")
+        entry['lbl_date'].configure(text=date_display)
         
-        # Preview
-        preview = note.get('content', '')[:100].replace('\n', ' ') + "..."
-        ctk.CTkLabel(card, text=preview, font=self.get_font(-1), text_color=self.colors['main_text'], anchor="w").pack(fill="x", padx=15, pady=(0, 5))
+        entry['lbl_preview'].configure(text=note_preview_text(note))
         
         # Tags
-        tags = note.get('tags', [])
-        if tags:
-            tags_text = " ".join([f"#{t}" if not t.startswith('#') else t for t in tags])
-            ctk.CTkLabel(card, text=tags_text, font=self.get_font(-3, "italic"), text_color=self.colors['accent'], anchor="w").pack(fill="x", padx=15, pady=(0, 5))
-        
-        # Open Button
-        ctk.CTkButton(card, text="Open Note", command=lambda: self.open_note(note),
-                    fg_color=self.colors.get('button_primary', 
-                    self.colors['primary']), 
-                    text_color=self.colors.get('button_text', 'white'),
-                    height=30, font=self.get_font(-1)).pack(fill="x", padx=15, pady=(0, 10))
-        # Hover color change removed as requested
+        tags_text = note_tags_text(note)
+        lbl_tags = entry['lbl_tags']
+        if tags_text:
+            lbl_tags.configure(text=tags_text)
+            if not lbl_tags.winfo_manager():
+                lbl_tags.pack(fill="x", padx=15, pady=(0, 5), before=entry['btn_open'])
+        elif lbl_tags.winfo_manager():
+            lbl_tags.pack_forget()
 
     def add_notebook(self):
         # Open dialog
@@ -3087,9 +4241,8 @@ class NotebooksView:
     def on_notebook_created(self, name):
         self.show_all_notebooks()
         # Update sidebar
-        if isinstance(self.app, CourseMate):
-            self.app.sidebar.refresh_notebooks_list()
-            self.app.sidebar.refresh_stats()
+        if self.app is not None:
+            self.app.schedule_refresh('stats')
 
     def rename_notebook(self, notebook_name=None):
         target = notebook_name or self.selected_notebook
@@ -3109,9 +4262,8 @@ class NotebooksView:
             self.show_all_notebooks()
         
         # Update sidebar
-        if isinstance(self.app, CourseMate):
-            self.app.sidebar.refresh_notebooks_list()
-            self.app.sidebar.refresh_stats()
+        if self.app is not None:
+            self.app.schedule_refresh('stats')
 
     def delete_notebook(self, notebook_name=None):
         target = notebook_name or self.selected_notebook
@@ -3126,10 +4278,9 @@ class NotebooksView:
             # the top-level `current_view` is updated and the main area is
             # fully refreshed. Fall back to instance-level refresh if the
             # App instance cannot be found.
-            app = self.app or getattr(self.master, 'master', None)
-            if isinstance(app, CourseMate):
+            if self.app is not None:
                 try:
-                    app.show_notebooks()
+                    self.app.show_notebooks()
                 except Exception:
                     # Fall back to internal refresh
                     self.selected_notebook = None
@@ -3140,12 +4291,8 @@ class NotebooksView:
                 self.show_all_notebooks()
 
             # Update sidebar list and stats to reflect deletion
-            if isinstance(self.app, CourseMate):
-                try:
-                    self.app.sidebar.refresh_notebooks_list()
-                    self.app.sidebar.refresh_stats()
-                except Exception:
-                    pass
+            if self.app is not None:
+                self.app.schedule_refresh('stats')
 
     def delete_note(self, index):
         if not self.selected_notebook: return
@@ -3153,40 +4300,50 @@ class NotebooksView:
             self.data_manager.delete_note(self.selected_notebook, index)
             self.refresh_notebook_notes() # Refresh list keeping filter state
             # Update sidebar stats
-            if isinstance(self.app, CourseMate):
-                self.app.sidebar.refresh_stats()
+            if self.app is not None:
+                self.app.schedule_refresh('stats')
 
     def open_note(self, note):
-        NoteWindow(self.master, note, self.colors, self.data_manager, lambda: self.show_notebook(self.selected_notebook))
+        NoteWindow.open(self.master, note, self.colors, self.data_manager, lambda: self.show_notebook(self.selected_notebook))
 
 class SettingsView:
-    def __init__(self, master, data_manager, colors):
+    def __init__(self, master, data_manager, colors, app=None):
         self.master = master
         self.data_manager = data_manager
         self.colors = colors
+        self.app = app or TemplateDialog._get_app_instance(master)
+        # Lazily built sections opened before; kept on the app because the
+        # view is rebuilt on every theme/font change
+        self._open_sections = self.app.settings_open_sections
+        # Fonts shared by most widgets below; the view is rebuilt whenever
+        # the font settings change, so these never go stale
+        get_font = self.app.get_font
+        self._font_n = get_font(0)
+        self._font_nb = get_font(0, "bold")
+        self._font_ni = get_font(0, "italic")
+        self._font_sm = get_font(-1)
+        self._font_xs = get_font(-2)
+        self._font_1b = get_font(1, "bold")
+        self._font_2b = get_font(2, "bold")
         self.settings = data_manager.get_settings()
-        # Built-in study templates (read-only defaults)
-        self.builtin_study_templates = {
-            "Cornell Notes": "Title: \n\nQuestion/Keyword\n-\n-\n\nNotes\n-\n-\n\nSummary\n-\n_",
-            "Main Idea & Details": "Main Idea: ___\n\nDetail 1:\n-\n\nDetail 2:\n-\n\nDetail 3:\n-\n\nSummary:\n-",
-            "Modified Frayer Model": "Definition:\n-\n\nCharacteristics:\n-\n\nExamples:\n-\n\nNon-Examples:\n-",
-            "Polya's 4 Steps": "1. Understand the Problem:\n-\n\n2. Devise a Plan:\n-\n\n3. Carry Out the Plan:\n-\n\n4. Look Back:\n-",
-            "5W1H": "Who:\n-\n\nWhat:\n-\n\nWhen:\n-\n\nWhere:\n-\n\nWhy:\n-\n\nHow:\n-",
-            "Concept Map": "Central Concept:\n-\n\nRelated Concept 1:\n-\n\nRelated Concept 2:\n-\n\nConnections:\n-"
-        }
-        # User-managed categories
-        self.study_templates = dict(self.settings.get("study_templates", {}))
-        self.planner_templates = dict(self.settings.get("additional_templates", {}))
+        # Built-in study templates (read-only defaults, shared with HomeView)
+        self.builtin_study_templates = DEFAULT_STUDY_TEMPLATES
+        # User-managed categories: the stored dicts themselves, edited in
+        # place through _save_template/_remove_template
+        self.study_templates = self.settings.setdefault("study_templates", {})
+        self.planner_templates = self.settings.setdefault("additional_templates", {})
         # Ensure default built-in quotes are present in persistent settings
         # Merge defaults with any user-saved quotes so both appear in Settings
         try:
-            existing = list(self.settings.get("quotes", []))
+            existing = list(self.settings.get("quotes", []) or [])
             merged = existing.copy()
+            seen = set(existing)
             for dq in DEFAULT_QUOTES:
                 # Add default quote only if it's not already present
-                if dq not in merged:
+                if dq not in seen:
+                    seen.add(dq)
                     merged.append(dq)
-            if merged != existing:
+            if len(merged) != len(existing):
                 self.data_manager.update_setting("quotes", merged)
                 # Refresh local view of settings
                 self.settings = self.data_manager.get_settings()
@@ -3197,18 +4354,45 @@ class SettingsView:
         self.container = ctk.CTkScrollableFrame(master, fg_color="transparent")
         self.container.pack(fill="both", expand=True, padx=20, pady=20)
 
-        ctk.CTkLabel(self.container, text="SETTINGS", font=master.master.get_font(6, "bold"), text_color=self.colors['main_text']).pack(anchor="w", pady=(0, 10))
+        ctk.CTkLabel(self.container, text="SETTINGS", font=self.app.get_font(6, "bold"), text_color=self.colors['main_text']).pack(anchor="w", pady=(0, 10))
 
         self.templates_frame = None
+        self._quote_limit = SETTINGS_ROW_PAGE_SIZE  # quote rows built before "Show more"
+        self._quotes_more_btn = None
+        self._quote_rows = []
+        self._quote_spare = []  # hidden rows kept for reuse (see _delete_quote_row)
+        self._quotes_empty_label = None
+        # Appearance is built right away; the quotes and templates sections
+        # (the bulk of the widgets) only when the user first opens them
         self._setup_appearance_section()
-        self._setup_inspiration_section()
-        self._setup_templates_section()
+        self._lazy_section('_inspiration_holder', "Inspiration & Quotes", self._setup_inspiration_section)
+        self._lazy_section('_templates_holder', "Templates", self._setup_templates_section)
+
+    def _lazy_section(self, attr, title, build):
+        """Reserve a slot (stored as self.<attr>) for a section that build()
+        fills on first click, or right away if it was opened before."""
+        holder = ctk.CTkFrame(self.container, fg_color="transparent")
+        holder.pack(fill="x")
+        setattr(self, attr, holder)
+        if title in self._open_sections:
+            build()
+            return
+        btn = ctk.CTkButton(holder, text=f"{title}  ▸", anchor="w", height=44, corner_radius=10,
+                            fg_color=self.colors['card_bg'], hover_color=self.colors.get('card_hover', self.colors['card_bg']),
+                            text_color=self.colors['main_text'], font=self._font_2b)
+        btn.configure(command=partial(self._expand_section, title, btn, build))
+        btn.pack(fill="x", pady=10)
+
+    def _expand_section(self, title, btn, build):
+        self._open_sections.add(title)
+        btn.destroy()
+        build()
 
     def _setup_appearance_section(self):
         frame = ctk.CTkFrame(self.container, fg_color=self.colors['card_bg'], corner_radius=10)
         frame.pack(fill="x", pady=10)
         
-        ctk.CTkLabel(frame, text="Appearance", font=self.master.master.get_font(2, "bold"), text_color=self.colors['main_text']).pack(anchor="w", padx=20, pady=15)
+        ctk.CTkLabel(frame, text="Appearance", font=self._font_2b, text_color=self.colors['main_text']).pack(anchor="w", padx=20, pady=15)
         
         # Shared layout settings for appearance rows (label + control)
         control_width = 200
@@ -3218,7 +4402,7 @@ class SettingsView:
         row1.pack(fill="x", padx=20, pady=5)
         row1.grid_columnconfigure(0, weight=0)
         row1.grid_columnconfigure(1, weight=1)
-        ctk.CTkLabel(row1, text="Theme Color:", font=self.master.master.get_font(0), text_color=self.colors['main_text']).grid(row=0, column=0, sticky="w")
+        ctk.CTkLabel(row1, text="Theme Color:", font=self._font_n, text_color=self.colors['main_text']).grid(row=0, column=0, sticky="w")
 
         self.theme_var = ctk.StringVar(value=self.settings.get("theme", "CourseMate Theme"))
         themes = list(THEMES.keys())
@@ -3231,7 +4415,7 @@ class SettingsView:
             button_color=self.colors.get('accent'),
             text_color=self.colors.get('dropdown_text', 'white'),
             width=control_width,
-            font=self.master.master.get_font(0)
+            font=self._font_n
         )
         theme_menu.grid(row=0, column=1, sticky="e", padx=(30, 0))
         
@@ -3240,7 +4424,7 @@ class SettingsView:
         row2.pack(fill="x", padx=20, pady=5)
         row2.grid_columnconfigure(0, weight=0)
         row2.grid_columnconfigure(1, weight=1)
-        ctk.CTkLabel(row2, text="Font Style:", font=self.master.master.get_font(0), text_color=self.colors['main_text']).grid(row=0, column=0, sticky="w")
+        ctk.CTkLabel(row2, text="Font Style:", font=self._font_n, text_color=self.colors['main_text']).grid(row=0, column=0, sticky="w")
         
         self.font_var = ctk.StringVar(value=self.settings.get("font_family", "Open Sans"))
         fonts = [ "Alice", "Courier New", "OpenDyslexic", "Open Sans"]
@@ -3253,7 +4437,7 @@ class SettingsView:
             button_color=self.colors.get('accent'),
             text_color=self.colors.get('dropdown_text', 'white'),
             width=control_width,
-            font=self.master.master.get_font(0)
+            font=self._font_n
         )
         font_menu.grid(row=0, column=1, sticky="e", padx=(30, 0))
         # Font Size
@@ -3261,7 +4445,7 @@ class SettingsView:
         row3.pack(fill="x", padx=20, pady=(5, 20))
         row3.grid_columnconfigure(0, weight=0)
         row3.grid_columnconfigure(1, weight=1)
-        ctk.CTkLabel(row3, text="Font Size:", font=self.master.master.get_font(0), text_color=self.colors['main_text']).grid(row=0, column=0, sticky="w")
+        ctk.CTkLabel(row3, text="Font Size:", font=self._font_n, text_color=self.colors['main_text']).grid(row=0, column=0, sticky="w")
         
         self.size_var = ctk.StringVar(value=self.settings.get("font_size", "Normal"))
         sizes = ["Normal", "Large"]
@@ -3274,40 +4458,40 @@ class SettingsView:
             button_color=self.colors.get('accent'),
             text_color=self.colors.get('dropdown_text', 'white'),
             width=control_width,
-            font=self.master.master.get_font(0)
+            font=self._font_n
         )
         size_menu.grid(row=0, column=1, sticky="e", padx=(30, 0))
 
  
 
     def _setup_inspiration_section(self):
-        frame = ctk.CTkFrame(self.container, fg_color=self.colors['card_bg'], corner_radius=10)
+        frame = ctk.CTkFrame(self._inspiration_holder, fg_color=self.colors['card_bg'], corner_radius=10)
         frame.pack(fill="x", pady=10)
         
-        ctk.CTkLabel(frame, text="Inspiration & Quotes", font=self.master.master.get_font(2, "bold"), text_color=self.colors['main_text']).pack(anchor="w", padx=20, pady=15)
+        ctk.CTkLabel(frame, text="Inspiration & Quotes", font=self._font_2b, text_color=self.colors['main_text']).pack(anchor="w", padx=20, pady=15)
         
         # Timer
         row1 = ctk.CTkFrame(frame, fg_color="transparent")
         row1.pack(fill="x", padx=20, pady=5)
-        ctk.CTkLabel(row1, text="Change Quote Every (seconds):", font=self.master.master.get_font(0), text_color=self.colors['main_text']).pack(side="left")
+        ctk.CTkLabel(row1, text="Change Quote Every (seconds):", font=self._font_n, text_color=self.colors['main_text']).pack(side="left")
         
-        self.timer_entry = ctk.CTkEntry(row1, width=60, placeholder_text="e.g. 30", fg_color=self.colors['background'], text_color=self.colors['main_text'], font=self.master.master.get_font(0))
+        self.timer_entry = ctk.CTkEntry(row1, width=60, placeholder_text="e.g. 30", fg_color=self.colors['background'], text_color=self.colors['main_text'], font=self._font_n)
         self.timer_entry.insert(0, str(self.settings.get("quote_timer", 30)))
         self.timer_entry.pack(side="left", padx=10)
         
         ctk.CTkButton(row1, text="Save Timer", width=80, command=self.save_timer,
-                      fg_color=self.colors['info'], font=self.master.master.get_font(0)).pack(side="left")
+                      fg_color=self.colors['info'], font=self._font_n).pack(side="left")
         
         # Add Quote
         row2 = ctk.CTkFrame(frame, fg_color="transparent")
         row2.pack(fill="x", padx=20, pady=(15, 5))
-        ctk.CTkLabel(row2, text="Add New Quote:", font=self.master.master.get_font(0), text_color=self.colors['main_text']).pack(anchor="w")
+        ctk.CTkLabel(row2, text="Add New Quote:", font=self._font_n, text_color=self.colors['main_text']).pack(anchor="w")
         
-        self.quote_entry = ctk.CTkEntry(row2, placeholder_text="Enter an inspirational quote with author...", fg_color=self.colors['background'], text_color=self.colors['main_text'], font=self.master.master.get_font(0))
+        self.quote_entry = ctk.CTkEntry(row2, placeholder_text="Enter an inspirational quote with author...", fg_color=self.colors['background'], text_color=self.colors['main_text'], font=self._font_n)
         self.quote_entry.pack(fill="x", pady=5)
         
         ctk.CTkButton(row2, text="Add Quote", command=self.add_quote,
-                  fg_color=self.colors['success'], font=self.master.master.get_font(0)).pack(anchor="e", pady=5)
+                  fg_color=self.colors['success'], font=self._font_n).pack(anchor="e", pady=5)
 
         # Quotes display area (shows all saved quotes, default + user-added)
         self.quotes_display_frame = ctk.CTkFrame(frame, fg_color="transparent")
@@ -3315,22 +4499,23 @@ class SettingsView:
 
         # Use a scrollable frame in case there are many quotes
         self.quotes_list = ctk.CTkScrollableFrame(self.quotes_display_frame, fg_color="transparent", height=120)
-        self.quotes_list.pack(fill="both", expand=True)
 
-        # Populate the quotes list from settings
+        # Populate the quotes list from settings before mapping it (one layout pass)
         self.refresh_quotes_list()
+        self.quotes_list.pack(fill="both", expand=True)
 
     def _setup_templates_section(self):
         if self.templates_frame is not None:
             self.templates_frame.destroy()
-        self.templates_frame = ctk.CTkFrame(self.container, fg_color=self.colors['card_bg'], corner_radius=10)
-        self.templates_frame.pack(fill="x", pady=10)
+        # Filled while still unmapped and packed once at the end, so Tk lays
+        # the section out once instead of after every row
+        self.templates_frame = ctk.CTkFrame(self._templates_holder, fg_color=self.colors['card_bg'], corner_radius=10)
 
-        ctk.CTkLabel(self.templates_frame, text="Templates", font=self.master.master.get_font(2, "bold"), text_color=self.colors['main_text']).pack(anchor="w", padx=20, pady=15)
+        ctk.CTkLabel(self.templates_frame, text="Templates", font=self._font_2b, text_color=self.colors['main_text']).pack(anchor="w", padx=20, pady=15)
         ctk.CTkLabel(
             self.templates_frame,
             text="View and manage your templates. Study templates are note-taking patterns; Planner templates help organize time and tasks.",
-            font=self.master.master.get_font(-2),
+            font=self._font_xs,
             text_color=self.colors['main_text'],
             wraplength=560,
             anchor="w",
@@ -3342,16 +4527,16 @@ class SettingsView:
         separator.pack(fill="x", padx=20, pady=(0, 15))
 
         # --- Create Custom Template Section ---
-        ctk.CTkLabel(self.templates_frame, text="Create Custom Template", font=self.master.master.get_font(1, "bold"), text_color=self.colors['main_text']).pack(anchor="w", padx=20, pady=(0, 8))
+        ctk.CTkLabel(self.templates_frame, text="Create Custom Template", font=self._font_1b, text_color=self.colors['main_text']).pack(anchor="w", padx=20, pady=(0, 8))
         
         form = ctk.CTkFrame(self.templates_frame, fg_color="transparent")
         form.pack(fill="x", padx=20, pady=(0, 6))
 
-        ctk.CTkLabel(form, text="Title", font=self.master.master.get_font(0), text_color=self.colors['main_text']).grid(row=0, column=0, sticky="w", padx=(0,8), pady=(0,6))
-        self.new_template_title = ctk.CTkEntry(form, placeholder_text="e.g. My Custom Study Template", fg_color=self.colors['background'], text_color=self.colors['main_text'], font=self.master.master.get_font(0))
+        ctk.CTkLabel(form, text="Title", font=self._font_n, text_color=self.colors['main_text']).grid(row=0, column=0, sticky="w", padx=(0,8), pady=(0,6))
+        self.new_template_title = ctk.CTkEntry(form, placeholder_text="e.g. My Custom Study Template", fg_color=self.colors['background'], text_color=self.colors['main_text'], font=self._font_n)
         self.new_template_title.grid(row=0, column=1, sticky="ew", pady=(0,6))
 
-        ctk.CTkLabel(form, text="Category", font=self.master.master.get_font(0), text_color=self.colors['main_text']).grid(row=0, column=2, sticky="w", padx=(16,8))
+        ctk.CTkLabel(form, text="Category", font=self._font_n, text_color=self.colors['main_text']).grid(row=0, column=2, sticky="w", padx=(16,8))
         self.new_template_category = ctk.StringVar(value="Study")
         self.new_template_category_menu = ctk.CTkOptionMenu(
             form,
@@ -3361,7 +4546,7 @@ class SettingsView:
             button_color=self.colors.get('accent'),
             text_color=self.colors.get('dropdown_text', 'white'),
             width=120,
-            font=self.master.master.get_font(0)
+            font=self._font_n
         )
         self.new_template_category_menu.grid(row=0, column=3, sticky="w")
         form.grid_columnconfigure(1, weight=1)
@@ -3378,8 +4563,8 @@ class SettingsView:
         # Action buttons
         btns = ctk.CTkFrame(self.templates_frame, fg_color="transparent")
         btns.pack(fill="x", padx=20, pady=(0, 15))
-        ctk.CTkButton(btns, text="Clear", width=100, fg_color=self.colors['danger'], command=self.clear_new_template_inputs, font=self.master.master.get_font(0)).pack(side="left")
-        ctk.CTkButton(btns, text="Add Template", width=130, fg_color=self.colors['success'], command=self.add_new_template, font=self.master.master.get_font(0)).pack(side="right")
+        ctk.CTkButton(btns, text="Clear", width=100, fg_color=self.colors['danger'], command=self.clear_new_template_inputs, font=self._font_n).pack(side="left")
+        ctk.CTkButton(btns, text="Add Template", width=130, fg_color=self.colors['success'], command=self.add_new_template, font=self._font_n).pack(side="right")
 
         # --- Separator line ---
         separator2 = ctk.CTkFrame(self.templates_frame, fg_color=self.colors.get('card_border', self.colors['secondary_text']), height=1)
@@ -3393,169 +4578,289 @@ class SettingsView:
         study_column = ctk.CTkFrame(columns_container, fg_color="transparent")
         study_column.pack(side="left", fill="both", expand=True, padx=(0, 10))
         
-        ctk.CTkLabel(study_column, text="Study Templates", font=self.master.master.get_font(1, "bold"), text_color=self.colors['main_text']).pack(anchor="w", pady=(0, 6))
+        ctk.CTkLabel(study_column, text="Study Templates", font=self._font_1b, text_color=self.colors['main_text']).pack(anchor="w", pady=(0, 6))
         
         study_list = ctk.CTkScrollableFrame(study_column, fg_color="transparent", height=240)
         study_list.pack(fill="both", expand=True)
-        
-        study_combined = {**self.builtin_study_templates}
-        for k, v in self.study_templates.items():
-            study_combined[k] = v
-        for title in study_combined.keys():
-            is_custom = title in self.study_templates
-            row = ctk.CTkFrame(study_list, fg_color="transparent", height=32)
-            row.pack(fill="x", pady=3)
-            try:
-                row.pack_propagate(False)
-            except Exception:
-                pass
-            ctk.CTkLabel(row, text=title, font=self.master.master.get_font(-1, "bold"), text_color=self.colors['main_text'], width=200, anchor="w").pack(side="left", padx=(8, 8))
-            actions = ctk.CTkFrame(row, fg_color="transparent")
-            actions.pack(side="right", padx=12, pady=2)
-            ctk.CTkButton(actions, text="Edit", width=72, height=26, fg_color=self.colors['info'],
-                          command=lambda t=title: self.edit_template_dialog(t, "Study"),
-                          font=self.master.master.get_font(-1)).pack(side="left")
 
         # Right Column: Additional Templates
         additional_column = ctk.CTkFrame(columns_container, fg_color="transparent")
         additional_column.pack(side="right", fill="both", expand=True, padx=(10, 0))
         
-        ctk.CTkLabel(additional_column, text="Additional Templates", font=self.master.master.get_font(1, "bold"), text_color=self.colors['main_text']).pack(anchor="w", pady=(0, 6))
+        ctk.CTkLabel(additional_column, text="Additional Templates", font=self._font_1b, text_color=self.colors['main_text']).pack(anchor="w", pady=(0, 6))
         
         additional_list = ctk.CTkScrollableFrame(additional_column, fg_color="transparent", height=240)
         additional_list.pack(fill="both", expand=True)
-        
-        for title in self.planner_templates.keys():
-            row = ctk.CTkFrame(additional_list, fg_color=self.colors['card_bg'], corner_radius=6, height=36)
+
+        # Rows are tracked per (category, title) so add/edit/delete only
+        # touch the rows they affect (see _sync_template_rows)
+        self._template_lists = {"Study": study_list, "Additional": additional_list}
+        self._template_rows = {}
+        self._template_limit = {"Study": SETTINGS_ROW_PAGE_SIZE, "Additional": SETTINGS_ROW_PAGE_SIZE}
+        self._template_more = {}
+        self._template_spare = {"Study": [], "Additional": []}  # hidden rows for reuse
+        self._template_complete = {}  # category -> no titles hidden at last sync
+        self._sync_template_rows("Study")
+        self._sync_template_rows("Additional")
+
+        self.templates_frame.pack(fill="x", pady=10)
+
+    def _template_titles(self, category):
+        """Titles listed for category, in display order."""
+        if category == "Study":
+            # User templates override built-ins of the same title in place
+            return list({**self.builtin_study_templates, **self.study_templates})
+        return list(self.planner_templates)
+
+    def _build_template_row(self, category, title):
+        spare = self._template_spare[category]
+        if spare:
+            # Refill a row hidden by an earlier delete/rename
+            entry = spare.pop()
+            entry['label'].configure(text=title)
+            entry['btn_edit'].configure(command=partial(self.edit_template_dialog, title, category))
+            if 'btn_del' in entry:
+                entry['btn_del'].configure(command=partial(self.delete_template, title, category))
+            entry['frame'].pack(fill="x", pady=3 if category == "Study" else 4)
+            self._template_rows[(category, title)] = entry
+            return
+        entry = {}
+        if category == "Study":
+            row = ctk.CTkFrame(self._template_lists[category], fg_color="transparent", height=32)
+            row.pack(fill="x", pady=3)
+            try:
+                row.pack_propagate(False)
+            except Exception:
+                pass
+            entry['label'] = ctk.CTkLabel(row, text=title, font=self.app.get_font(-1, "bold"), text_color=self.colors['main_text'], width=200, anchor="w")
+            entry['label'].pack(side="left", padx=(8, 8))
+            actions = ctk.CTkFrame(row, fg_color="transparent")
+            actions.pack(side="right", padx=12, pady=2)
+            entry['btn_edit'] = ctk.CTkButton(actions, text="Edit", width=72, height=26, fg_color=self.colors['info'],
+                          command=partial(self.edit_template_dialog, title, "Study"),
+                          font=self._font_sm)
+            entry['btn_edit'].pack(side="left")
+        else:
+            row = ctk.CTkFrame(self._template_lists[category], fg_color=self.colors['card_bg'], corner_radius=6, height=36)
             row.pack(fill="x", pady=4)
             try:
                 row.pack_propagate(False)
             except Exception:
                 pass
-            ctk.CTkLabel(row, text=title, font=self.master.master.get_font(0, "bold"), text_color=self.colors['main_text'], width=200, anchor="w").pack(side="left", padx=(8, 8))
+            entry['label'] = ctk.CTkLabel(row, text=title, font=self._font_nb, text_color=self.colors['main_text'], width=200, anchor="w")
+            entry['label'].pack(side="left", padx=(8, 8))
             actions = ctk.CTkFrame(row, fg_color="transparent")
             actions.pack(side="right", padx=12, pady=4)
-            ctk.CTkButton(actions, text="Edit", width=72, height=26, fg_color=self.colors['info'],
-                          command=lambda t=title: self.edit_template_dialog(t, "Additional"),
-                          font=self.master.master.get_font(-1)).pack(side="left", padx=(0,8))
-            ctk.CTkButton(actions, text="Delete", width=72, height=26, fg_color=self.colors['danger'],
-                          command=lambda t=title: self.delete_template(t, "Additional"),
-                          font=self.master.master.get_font(-1)).pack(side="left")
+            entry['btn_edit'] = ctk.CTkButton(actions, text="Edit", width=72, height=26, fg_color=self.colors['info'],
+                          command=partial(self.edit_template_dialog, title, "Additional"),
+                          font=self._font_sm)
+            entry['btn_edit'].pack(side="left", padx=(0,8))
+            entry['btn_del'] = ctk.CTkButton(actions, text="Delete", width=72, height=26, fg_color=self.colors['danger'],
+                          command=partial(self.delete_template, title, "Additional"),
+                          font=self._font_sm)
+            entry['btn_del'].pack(side="left")
+        entry['frame'] = row
+        self._template_rows[(category, title)] = entry
+
+    def _sync_template_rows(self, category):
+        """Bring category's list in line with the stored templates.
+
+        Rows of removed titles are hidden for reuse and missing rows within
+        the current page are appended; new and renamed titles sort last in
+        the stored dicts, so appending keeps the display order. A "Show
+        more" button stays last while titles remain hidden.
+        """
+        titles = self._template_titles(category)
+        listed = set(titles)
+        rows = self._template_rows
+        spare = self._template_spare[category]
+        for key in [k for k in rows if k[0] == category and k[1] not in listed]:
+            entry = rows.pop(key)
+            entry['frame'].pack_forget()
+            spare.append(entry)
+        limit = self._template_limit[category]
+        for title in titles[:limit]:
+            if (category, title) not in rows:
+                self._build_template_row(category, title)
+        self._template_complete[category] = len(titles) <= limit
+        btn = self._template_more.get(category)
+        if btn is not None:
+            btn.pack_forget()
+        if len(titles) > limit:
+            if btn is None:
+                btn = self._template_more[category] = ctk.CTkButton(
+                    self._template_lists[category], text="Show more", fg_color=self.colors['button_primary'],
+                    text_color=self.colors['button_text'], font=self._font_sm,
+                    command=partial(self._show_more_templates, category))
+            btn.pack(pady=6)
+
+    def _show_more_templates(self, category):
+        self._template_limit[category] += SETTINGS_ROW_PAGE_SIZE
+        self._sync_template_rows(category)
+
+    def _after_template_change(self, category):
+        """Update the affected list after an add/edit/delete."""
+        if self.templates_frame is None:
+            return
+        if self._template_complete[category]:
+            # Everything was visible: keep it that way, new row included
+            self._template_limit[category] = max(self._template_limit[category], len(self._template_titles(category)))
+        self._sync_template_rows(category)
 
     def update_setting(self, key, value):
         self.data_manager.update_setting(key, value)
         # Apply settings immediately
-        if isinstance(self.master.master.master, CourseMate):
-             self.master.master.master.apply_settings()
-        elif isinstance(self.master.master, CourseMate):
-             self.master.master.apply_settings()
+        if self.app is not None:
+            self.app.apply_settings()
         else:
             messagebox.showinfo("Settings Saved", f"{key.replace('_', ' ').title()} updated! Restart app to see full changes.")
 
     def change_theme(self, new_theme):
         self.data_manager.update_setting("theme", new_theme)
         # Apply settings immediately
-        if isinstance(self.master.master.master, CourseMate): 
-            self.master.master.master.apply_settings()
-        elif isinstance(self.master.master, CourseMate):
-             self.master.master.apply_settings()
+        if self.app is not None:
+            self.app.apply_settings()
         else:
              print("Could not find App instance to apply theme")
              messagebox.showinfo("Theme Saved", "Theme saved! Restart to apply (Dynamic update failed).")
 
-    def preview_theme(self, theme_name):
-        """Update the small preview UI to show the selected theme without saving."""
-        theme = THEMES.get(theme_name, THEMES['CourseMate Theme'])
-        try:
-            # Header
-            self.preview_header.configure(fg_color=theme.get('header_bg'))
-            self.preview_header_label.configure(text_color=theme.get('header_text'))
-            # Sidebar
-            self.preview_sidebar.configure(fg_color=theme.get('primary'))
-            self.preview_sidebar_label.configure(text_color=theme.get('sidebar_text'))
-            # Main
-            self.preview_main.configure(fg_color=theme.get('background'))
-            self.preview_main_label.configure(text_color=theme.get('main_text'))
-            # Sample controls (if created)
-            try:
-                self.preview_sample_label.configure(text_color=theme.get('secondary_text'))
-            except Exception:
-                pass
-            try:
-                self.preview_sample_dropdown.configure(fg_color=theme.get('dropdown_bg'), text_color=theme.get('dropdown_text'), button_color=theme.get('accent'))
-            except Exception:
-                pass
-            try:
-                self.preview_sample_entry.configure(fg_color=theme.get('card_bg'), text_color=theme.get('main_text'))
-            except Exception:
-                pass
-            try:
-                self.preview_sample_primary.configure(fg_color=theme.get('accent'), text_color="white")
-            except Exception:
-                pass
-            try:
-                self.preview_sample_secondary.configure(fg_color=theme.get('card_bg'), text_color=theme.get('main_text'))
-            except Exception:
-                pass
-        except Exception:
-            pass
-
     def save_timer(self):
-        try:
-            val = int(self.timer_entry.get())
-            if val < 5:
-                messagebox.showwarning("Invalid", "Timer must be at least 5 seconds.")
-                return
-            self.data_manager.update_setting("quote_timer", val)
-            messagebox.showinfo("Saved", "Quote timer updated.")
-        except ValueError:
+        text = self.timer_entry.get().strip()
+        # Only plain unsigned digits ('+10', '1_000' and '²' are rejected)
+        if not text.isdecimal():
             messagebox.showerror("Error", "Please enter a valid number.")
+            return
+        val = int(text)
+        if val < QUOTE_TIMER_MIN:
+            messagebox.showwarning("Invalid", f"Timer must be at least {QUOTE_TIMER_MIN} seconds.")
+            return
+        if val > QUOTE_TIMER_MAX:
+            messagebox.showwarning("Invalid", f"Timer must be at most {QUOTE_TIMER_MAX} seconds (one day).")
+            return
+        self.data_manager.update_setting("quote_timer", val)
+        sidebar = getattr(self.app, 'sidebar', None)
+        if sidebar is not None:
+            sidebar.set_quote_interval(val)
+        messagebox.showinfo("Saved", "Quote timer updated.")
 
     def add_quote(self):
         quote = self.quote_entry.get().strip()
         if quote:
-            # Read current quotes from persistent settings and append
-            quotes = self.data_manager.get_settings().get("quotes", [])
-            quotes.append(quote)
-            self.data_manager.update_setting("quotes", quotes)
+            # Append to the stored quotes list in place
+            self.data_manager.mutate_setting("quotes", lambda qs: qs.append(quote))
+            quotes = self.data_manager.get_settings()["quotes"]
             # Clear entry and refresh display
             self.quote_entry.delete(0, "end")
             messagebox.showinfo("Success", "Quote added to your collection!")
-            # Refresh the displayed list so the user sees the new quote immediately
+            # Show the new quote immediately by adding just its row
+            # (unless earlier quotes are still behind "Show more")
             try:
-                self.refresh_quotes_list()
+                if len(self._quote_rows) == len(quotes) - 1:
+                    self._append_quote_row(len(quotes) - 1, quote)
+                    self._quote_limit = max(self._quote_limit, len(self._quote_rows))
+                self._sync_quotes_more(len(quotes))
             except Exception:
                 pass
         else:
             messagebox.showwarning("Empty", "Please enter a quote.")
 
     def refresh_quotes_list(self):
-        """Refresh the quotes shown in Settings (default + added)."""
-        # Clear existing widgets
-        try:
-            for w in self.quotes_list.winfo_children():
-                w.destroy()
-        except Exception:
-            return
+        """Rebuild the quotes shown in Settings (default + added).
+
+        Only used when the section is set up; add/edit/delete then touch
+        just their own row (see _append_quote_row and friends).
+        """
+        # Hide the current rows for reuse instead of destroying each one
+        # (nothing to do on first build, when the list is still empty)
+        for entry in self._quote_rows:
+            entry['frame'].pack_forget()
+        self._quote_spare.extend(self._quote_rows)
+        self._quote_rows = []
+        if self._quotes_empty_label is not None:
+            self._quotes_empty_label.pack_forget()
+        if self._quotes_more_btn is not None:
+            self._quotes_more_btn.pack_forget()
 
         quotes = self.data_manager.get_settings().get("quotes", [])
         if not quotes:
-            ctk.CTkLabel(self.quotes_list, text="No saved quotes.", font=self.master.master.get_font(0, "italic"), text_color=self.colors['secondary_text']).pack(pady=8)
+            self._show_quotes_empty()
             return
-        for idx, q in enumerate(quotes):
-            # Each quote gets a framed row with the quote text and action buttons
-            row = ctk.CTkFrame(self.quotes_list, fg_color=self.colors['card_bg'], corner_radius=6)
-            row.pack(fill="x", pady=4, padx=4)
-            # Use a larger font for quotes in the settings list for readability
-            ctk.CTkLabel(row, text=f'"{q}"', font=self.master.master.get_font(0), text_color=self.colors['main_text'], wraplength=520, anchor="w", justify="left").pack(fill="x", padx=8, pady=6, side="left", expand=True)
-
-            actions = ctk.CTkFrame(row, fg_color="transparent")
-            actions.pack(side="right", padx=8, pady=6)
-
-            # Edit button
-            ctk.CTkButton(actions, text="Edit", width=70, height=28, fg_color=self.colors['info'], command=lambda i=idx: self.edit_quote(i), font=self.master.master.get_font(-1)).pack(side="left", padx=(0,6))
-            # Delete button
-            ctk.CTkButton(actions, text="Delete", width=70, height=28, fg_color=self.colors['danger'], command=lambda i=idx: self.delete_quote(i), font=self.master.master.get_font(-1)).pack(side="left")
+        for idx, q in enumerate(quotes[:self._quote_limit]):
+            self._append_quote_row(idx, q)
+        self._sync_quotes_more(len(quotes))
+
+    def _sync_quotes_more(self, total):
+        """Keep the "Show more" button last in the list while rows are hidden."""
+        btn = self._quotes_more_btn
+        if btn is not None:
+            btn.pack_forget()
+        if total > len(self._quote_rows):
+            if btn is None:
+                btn = self._quotes_more_btn = ctk.CTkButton(self.quotes_list, text="Show more", command=self._show_more_quotes, fg_color=self.colors['button_primary'], text_color=self.colors['button_text'], font=self._font_n)
+            btn.pack(pady=6)
+
+    def _show_more_quotes(self):
+        quotes = self.data_manager.get_settings().get("quotes", [])
+        self._quote_limit = len(self._quote_rows) + SETTINGS_ROW_PAGE_SIZE
+        for idx in range(len(self._quote_rows), min(self._quote_limit, len(quotes))):
+            self._append_quote_row(idx, quotes[idx])
+        self._sync_quotes_more(len(quotes))
+
+    def _show_quotes_empty(self):
+        if self._quotes_empty_label is None:
+            self._quotes_empty_label = ctk.CTkLabel(self.quotes_list, text="No saved quotes.", font=self._font_ni, text_color=self.colors['secondary_text'])
+        self._quotes_empty_label.pack(pady=8)
+
+    def _append_quote_row(self, idx, q):
+        """Add the row for quote q (at position idx) to the end of the list."""
+        if self._quotes_empty_label is not None:
+            self._quotes_empty_label.pack_forget()
+        if self._quote_spare:
+            # Refill a row hidden by an earlier delete instead of building one
+            entry = self._quote_spare.pop()
+            entry['label'].configure(text=f'"{q}"')
+            entry['btn_edit'].configure(command=partial(self.edit_quote, idx))
+            entry['btn_del'].configure(command=partial(self.delete_quote, idx))
+            entry['frame'].pack(fill="x", pady=4, padx=4)
+            self._quote_rows.append(entry)
+            return
+        # Each quote gets a framed row with the quote text and action buttons
+        row = ctk.CTkFrame(self.quotes_list, fg_color=self.colors['card_bg'], corner_radius=6)
+        row.pack(fill="x", pady=4, padx=4)
+        # Use a larger font for quotes in the settings list for readability
+        label = ctk.CTkLabel(row, text=f'"{q}"', font=self._font_n, text_color=self.colors['main_text'], wraplength=520, anchor="w", justify="left")
+        label.pack(fill="x", padx=8, pady=6, side="left", expand=True)
+
+        actions = ctk.CTkFrame(row, fg_color="transparent")
+        actions.pack(side="right", padx=8, pady=6)
+
+        # Edit button
+        btn_edit = ctk.CTkButton(actions, text="Edit", width=70, height=28, fg_color=self.colors['info'], command=partial(self.edit_quote, idx), font=self._font_sm)
+        btn_edit.pack(side="left", padx=(0,6))
+        # Delete button
+        btn_del = ctk.CTkButton(actions, text="Delete", width=70, height=28, fg_color=self.colors['danger'], command=partial(self.delete_quote, idx), font=self._font_sm)
+        btn_del.pack(side="left")
+        self._quote_rows.append({'frame': row, 'label': label, 'btn_edit': btn_edit, 'btn_del': btn_del})
+
+    def _update_quote_row(self, idx, q):
+        self._quote_rows[idx]['label'].configure(text=f'"{q}"')
+
+    def _delete_quote_row(self, idx):
+        """Drop row idx and point the following rows' buttons at their new index."""
+        entry = self._quote_rows.pop(idx)
+        entry['frame'].pack_forget()
+        self._quote_spare.append(entry)
+        for i in range(idx, len(self._quote_rows)):
+            entry = self._quote_rows[i]
+            entry['btn_edit'].configure(command=partial(self.edit_quote, i))
+            entry['btn_del'].configure(command=partial(self.delete_quote, i))
+        # Pull the first hidden quote up so the page stays full
+        quotes = self.data_manager.get_settings().get("quotes", [])
+        if len(quotes) > len(self._quote_rows) and len(self._quote_rows) < self._quote_limit:
+            self._append_quote_row(len(self._quote_rows), quotes[len(self._quote_rows)])
+        self._sync_quotes_more(len(quotes))
+        if not self._quote_rows:
+            self._show_quotes_empty()
 
     def edit_quote(self, index):
         """Edit an existing quote by index."""
@@ -3563,18 +4868,15 @@ class SettingsView:
         if index < 0 or index >= len(quotes):
             return
         current = quotes[index]
-        dlg = InputDialog(self.master, "Edit Quote", "Modify quote:", initialvalue=current)
-        self.master.wait_window(dlg)
-        new_val = dlg.result
+        new_val = InputDialog.ask(self.master, "Edit Quote", "Modify quote:", initialvalue=current)
         if new_val is None:
             return
         new_val = new_val.strip()
         if not new_val:
             messagebox.showwarning("Invalid", "Quote cannot be empty.")
             return
-        quotes[index] = new_val
-        self.data_manager.update_setting("quotes", quotes)
-        self.refresh_quotes_list()
+        self.data_manager.mutate_setting("quotes", lambda qs: qs.__setitem__(index, new_val))
+        self._update_quote_row(index, new_val)
 
     def delete_quote(self, index):
         """Delete quote at index after confirmation."""
@@ -3583,9 +4885,8 @@ class SettingsView:
             return
         if messagebox.askyesno("Delete Quote", "Delete this quote? This cannot be undone."):
             try:
-                quotes.pop(index)
-                self.data_manager.update_setting("quotes", quotes)
-                self.refresh_quotes_list()
+                self.data_manager.mutate_setting("quotes", lambda qs: qs.pop(index))
+                self._delete_quote_row(index)
             except Exception:
                 messagebox.showerror("Error", "Could not delete quote.")
 
@@ -3603,18 +4904,14 @@ class SettingsView:
             if title in self.builtin_study_templates or title in self.study_templates:
                 messagebox.showerror("Duplicate", "A Study template with this title already exists.")
                 return
-            self.study_templates[title] = content
-            self.data_manager.update_setting("study_templates", self.study_templates)
         else:
             if title in self.planner_templates:
                 messagebox.showerror("Duplicate", "A Planner template with this title already exists.")
                 return
-            self.planner_templates[title] = content
-            self.data_manager.update_setting("additional_templates", self.planner_templates)
-        self.settings = self.data_manager.get_settings()
+        self._save_template(category, title, content)
         messagebox.showinfo("Success", "Template added.")
         self.clear_new_template_inputs()
-        self._setup_templates_section()
+        self._after_template_change(category)
 
     def clear_new_template_inputs(self):
         try:
@@ -3679,46 +4976,50 @@ class SettingsView:
                 if new_title != template_title and (new_title in self.builtin_study_templates or new_title in self.study_templates):
                     messagebox.showerror("Duplicate", "A Study template with this title already exists.")
                     return
-                # Apply rename/update
-                if new_title != template_title:
-                    self.study_templates.pop(template_title, None)
-                self.study_templates[new_title] = new_structure
-                self.data_manager.update_setting("study_templates", self.study_templates)
             else:
                 if new_title != template_title and new_title in self.planner_templates:
                     messagebox.showerror("Duplicate", "A Planner template with this title already exists.")
                     return
-                if new_title != template_title:
-                    self.planner_templates.pop(template_title, None)
-                self.planner_templates[new_title] = new_structure
-                self.data_manager.update_setting("additional_templates", self.planner_templates)
-            self.settings = self.data_manager.get_settings()
+            # Apply rename/update
+            self._save_template(category, new_title, new_structure, old_title=template_title)
             messagebox.showinfo("Success", "Template updated!")
-            self._setup_templates_section()
-        TemplateDialog(self.master, title_init=template_title, structure_init=structure, on_save=on_save, is_edit=True)
+            if new_title != template_title:
+                self._after_template_change(category)
+        TemplateDialog.open(self.master, title_init=template_title, structure_init=structure, on_save=on_save, is_edit=True)
 
     def delete_template(self, template_title, category):
         if not messagebox.askyesno("Delete Template", f"Delete template '{template_title}'? This cannot be undone."):
             return
-        if category == "Study":
-            if template_title in self.study_templates:
-                self.study_templates.pop(template_title, None)
-                self.data_manager.update_setting("study_templates", self.study_templates)
-        else:
-            if template_title in self.planner_templates:
-                self.planner_templates.pop(template_title, None)
-                self.data_manager.update_setting("additional_templates", self.planner_templates)
-        self.settings = self.data_manager.get_settings()
+        self._remove_template(category, template_title)
         messagebox.showinfo("Deleted", "Template deleted.")
-        self._setup_templates_section()
+        self._after_template_change(category)
+
+    @staticmethod
+    def _template_key(category):
+        return "study_templates" if category == "Study" else "additional_templates"
+
+    def _save_template(self, category, title, content, old_title=None):
+        """Store a user template in place (renamed from old_title, if given); one save."""
+        def apply(templates):
+            if old_title is not None and old_title != title:
+                templates.pop(old_title, None)
+            templates[title] = content
+        self.data_manager.mutate_setting(self._template_key(category), apply, default=dict)
+
+    def _remove_template(self, category, title):
+        """Drop a user template; saves only if it existed."""
+        templates = self.study_templates if category == "Study" else self.planner_templates
+        if title in templates:
+            self.data_manager.mutate_setting(self._template_key(category), lambda t: t.pop(title, None), default=dict)
 
 
 class AboutView:
     """Simple About page describing the app."""
-    def __init__(self, master, data_manager, colors):
+    def __init__(self, master, data_manager, colors, app):
         self.master = master
         self.data_manager = data_manager
         self.colors = colors
+        self.app = app
         # Scrollable container
         self.container = ctk.CTkScrollableFrame(master, fg_color="transparent")
         self.container.pack(fill="both", expand=True, padx=20, pady=20)
@@ -3770,7 +5071,7 @@ class AboutView:
         # Small Close/Back button to go Home
         btn_frame = ctk.CTkFrame(self.container, fg_color="transparent")
         btn_frame.pack(fill="x", pady=(20,0))
-        ctk.CTkButton(btn_frame, text="Back to Home", command=lambda: getattr(self.master.master, 'show_home', lambda: None)(), fg_color=self.colors.get('button_primary', self.colors['primary']), text_color=self.colors.get('button_text', 'white')).pack(side="left")
+        ctk.CTkButton(btn_frame, text="Back to Home", command=self.app.show_home, fg_color=self.colors.get('button_primary', self.colors['primary']), text_color=self.colors.get('button_text', 'white')).pack(side="left")
 
 
 class SearchView:
@@ -3833,11 +5134,7 @@ class SearchView:
         for notebook_name, notebook_data in notebooks.items():
             notes = notebook_data.get("notes", [])
             for note in notes:
-                title = note.get("title", "").lower()
-                content = note.get("content", "").lower()
-                tags_str = " ".join(note.get('tags', [])).lower()
-                
-                if self.query in title or self.query in content or self.query in tags_str:
+                if self.query in note_search_text(note):
                     self.results.append({
                         "title": note.get("title", "Untitled"),
                         "content": note.get("content", ""),
@@ -3849,11 +5146,7 @@ class SearchView:
         # Search in unassigned notes
         unassigned = self.data_manager.data.get("unassigned_notes", [])
         for note in unassigned:
-            title = note.get("title", "").lower()
-            content = note.get("content", "").lower()
-            tags_str = " ".join(note.get('tags', [])).lower()
-            
-            if self.query in title or self.query in content or self.query in tags_str:
+            if self.query in note_search_text(note):
                 self.results.append({
                     "title": note.get("title", "Untitled"),
                     "content": note.get("content", ""),
@@ -3909,8 +5202,8 @@ class SearchView:
         notebook_name = result["notebook"]
         
         # Create NoteWindow to view/edit the note
-        NoteWindow(self.master, self.data_manager, self.colors, note_data, 
-                  notebook_name=notebook_name, app=self.app)
+        NoteWindow.open(self.master, note_data, self.colors, self.data_manager,
+                        lambda: self.app.schedule_refresh('stats'))
 
 
 if __name__ == "__main__":